@@ -10,25 +10,155 @@ Usage:
 Web UI will be available at: http://localhost:8089
 """
 
-from locust import HttpUser, task, between
-import json
-import random
-import io
+from locust import task, between, events
+from locust.contrib.fasthttp import FastHttpUser
+from urllib.parse import urlencode
+from gevent.pool import Pool
 import os
+import itertools
+import orjson
+import random
+import requests
+
+from payloads import UPLOAD_CONTENT_TYPE, encode_upload, requires, requires_auth
+
+# FastHttpSession sends ``data`` verbatim, so form bodies are encoded up front
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Simple PDF structure for testing, built once and shared by every user
+SAMPLE_PDF = b"""%PDF-1.4
+1 0 obj
+<<
+/Type /Catalog
+/Pages 2 0 R
+>>
+endobj
+
+2 0 obj
+<<
+/Type /Pages
+/Kids [3 0 R]
+/Count 1
+>>
+endobj
+
+3 0 obj
+<<
+/Type /Page
+/Parent 2 0 R
+/MediaBox [0 0 612 792]
+/Contents 4 0 R
+>>
+endobj
 
+4 0 obj
+<<
+/Length 56
+>>
+stream
+BT
+/F1 12 Tf
+100 700 Td
+(Load Test Contract Content) Tj
+ET
+endstream
+endobj
 
-class ContractAnalysisUser(HttpUser):
+xref
+0 5
+0000000000 65535 f
+0000000009 00000 n
+0000000058 00000 n
+0000000115 00000 n
+0000000204 00000 n
+trailer
+<<
+/Size 5
+/Root 1 0 R
+>>
+startxref
+309
+%%EOF"""
+
+# Direct analysis ignores the filename, so its multipart body never varies
+ANALYZE_BODY = encode_upload("analysis_test.pdf", SAMPLE_PDF)
+
+# Number of accounts registered up front and shared by ContractAnalysisUser
+TOKEN_POOL_SIZE = int(os.getenv("LOADTEST_TOKEN_POOL_SIZE", "50"))
+
+# (user_id, auth_token, client_id) tuples filled by the test_start hook
+_token_pool = []
+
+
+def _register_pooled_user(host, index):
+    """Register, login and create a client for one pooled account"""
+    user_id = f"loadtest_user_pool_{index}"
+    password = "LoadTest123!"
+
+    with requests.Session() as session:
+        session.post(f"{host}/api/v1/auth/register", json={
+            "username": user_id,
+            "email": f"{user_id}@loadtest.com",
+            "password": password
+        })
+
+        response = session.post(
+            f"{host}/api/v1/auth/login",
+            data={"username": user_id, "password": password}
+        )
+        if response.status_code != 200:
+            return None
+        auth_token = orjson.loads(response.content)["access_token"]
+
+        response = session.post(
+            f"{host}/api/v1/clients/",
+            json={
+                "name": f"LoadTest Client {user_id}",
+                "company": "LoadTest Inc.",
+                "email": f"client_{user_id}@loadtest.com"
+            },
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        client_id = orjson.loads(response.content)["id"] if response.status_code == 200 else None
+
+    return user_id, auth_token, client_id
+
+
+@events.test_start.add_listener
+def prepare_token_pool(environment, **kwargs):
+    """Register the shared accounts in parallel before users are spawned"""
+    if _token_pool or not environment.host or TOKEN_POOL_SIZE <= 0:
+        return
+
+    pool = Pool(TOKEN_POOL_SIZE)
+    results = pool.map(
+        lambda index: _register_pooled_user(environment.host, index),
+        range(TOKEN_POOL_SIZE)
+    )
+    _token_pool.extend(result for result in results if result)
+
+
+class ContractAnalysisUser(FastHttpUser):
     """
     Simulates a user interacting with the PWC Contract Analysis API
     """
     wait_time = between(1, 3)  # Wait 1-3 seconds between requests
+    concurrency = 50  # Size of the pooled geventhttpclient connection set
 
     def on_start(self):
         """Setup method called when user starts"""
         self.auth_token = None
+        self.auth_headers = {}
         self.user_id = f"loadtest_user_{random.randint(1000, 9999)}"
         self.client_id = None
         self.contract_ids = []
+        self._seq = itertools.count()
+
+        # Reuse a pre-registered account when the pool is available
+        if _token_pool:
+            self.user_id, auth_token, self.client_id = random.choice(_token_pool)
+            self.set_auth_token(auth_token)
+            return
 
         # Register and login
         self.register_and_login()
@@ -36,6 +166,12 @@ class ContractAnalysisUser(HttpUser):
         # Create a test client
         self.create_test_client()
 
+    def set_auth_token(self, auth_token):
+        """Store the token and the headers derived from it"""
+        self.auth_token = auth_token
+        self.auth_headers = {"Authorization": f"Bearer {auth_token}"}
+        self.upload_headers = {**self.auth_headers, "Content-Type": UPLOAD_CONTENT_TYPE}
+
     def register_and_login(self):
         """Register a test user and obtain auth token"""
         # Register user
@@ -59,10 +195,15 @@ class ContractAnalysisUser(HttpUser):
             "password": user_data["password"]
         }
 
-        with self.client.post("/api/v1/auth/login", data=login_data, catch_response=True) as response:
+        with self.client.post(
+            "/api/v1/auth/login",
+            data=urlencode(login_data),
+            headers=FORM_HEADERS,
+            catch_response=True
+        ) as response:
             if response.status_code == 200:
-                token_data = response.json()
-                self.auth_token = token_data["access_token"]
+                token_data = orjson.loads(response.content)
+                self.set_auth_token(token_data["access_token"])
                 response.success()
             else:
                 response.failure(f"Login failed: {response.status_code}")
@@ -78,169 +219,69 @@ class ContractAnalysisUser(HttpUser):
             "email": f"client_{self.user_id}@loadtest.com"
         }
 
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
-
-        with self.client.post("/api/v1/clients/", json=client_data, headers=headers, catch_response=True) as response:
+        with self.client.post("/api/v1/clients/", json=client_data, headers=self.auth_headers, catch_response=True) as response:
             if response.status_code == 200:
-                self.client_id = response.json()["id"]
+                self.client_id = orjson.loads(response.content)["id"]
                 response.success()
             else:
                 response.failure(f"Client creation failed: {response.status_code}")
 
-    @property
-    def auth_headers(self):
-        """Get authorization headers"""
-        if not self.auth_token:
-            return {}
-        return {"Authorization": f"Bearer {self.auth_token}"}
-
     def get_sample_pdf_content(self):
-        """Generate a simple PDF-like content for testing"""
-        # Simple PDF structure for testing
-        pdf_content = b"""%PDF-1.4
-1 0 obj
-<<
-/Type /Catalog
-/Pages 2 0 R
->>
-endobj
-
-2 0 obj
-<<
-/Type /Pages
-/Kids [3 0 R]
-/Count 1
->>
-endobj
-
-3 0 obj
-<<
-/Type /Page
-/Parent 2 0 R
-/MediaBox [0 0 612 792]
-/Contents 4 0 R
->>
-endobj
-
-4 0 obj
-<<
-/Length 56
->>
-stream
-BT
-/F1 12 Tf
-100 700 Td
-(Load Test Contract Content) Tj
-ET
-endstream
-endobj
-
-xref
-0 5
-0000000000 65535 f
-0000000009 00000 n
-0000000058 00000 n
-0000000115 00000 n
-0000000204 00000 n
-trailer
-<<
-/Size 5
-/Root 1 0 R
->>
-startxref
-309
-%%EOF"""
-        return pdf_content
+        """Return the shared sample PDF used for upload tests"""
+        return SAMPLE_PDF
 
+    # Fixed GETs rely on FastHttpSession failing non-2xx responses itself,
+    # which avoids a catch_response wrapper per call
     @task(3)
     def health_check(self):
         """Test health check endpoint (high frequency)"""
-        with self.client.get("/healthz", catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Health check failed: {response.status_code}")
+        self.client.get("/healthz")
 
     @task(2)
     def readiness_check(self):
         """Test readiness check endpoint"""
-        with self.client.get("/readyz", catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Readiness check failed: {response.status_code}")
+        self.client.get("/readyz")
 
     @task(5)
+    @requires_auth
     def list_contracts(self):
         """Test listing contracts endpoint"""
-        if not self.auth_token:
-            return
-
-        with self.client.get("/api/v1/contracts/", headers=self.auth_headers, catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"List contracts failed: {response.status_code}")
+        self.client.get("/api/v1/contracts/", headers=self.auth_headers)
 
     @task(5)
+    @requires_auth
     def list_clients(self):
         """Test listing clients endpoint"""
-        if not self.auth_token:
-            return
-
-        with self.client.get("/api/v1/clients/", headers=self.auth_headers, catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"List clients failed: {response.status_code}")
+        self.client.get("/api/v1/clients/", headers=self.auth_headers)
 
     @task(2)
+    @requires(lambda user: user.auth_token and user.client_id)
     def upload_contract(self):
         """Test contract upload endpoint"""
-        if not self.auth_token or not self.client_id:
-            return
-
         pdf_content = self.get_sample_pdf_content()
-        filename = f"loadtest_contract_{random.randint(1000, 9999)}.pdf"
-
-        files = {
-            "file": (filename, io.BytesIO(pdf_content), "application/pdf")
-        }
-        data = {
-            "client_id": self.client_id
-        }
+        filename = f"loadtest_contract_{next(self._seq)}.pdf"
 
         with self.client.post(
             "/api/v1/contracts/",
-            files=files,
-            data=data,
-            headers=self.auth_headers,
+            data=encode_upload(filename, pdf_content, self.client_id),
+            headers=self.upload_headers,
             catch_response=True
         ) as response:
             if response.status_code == 200:
-                contract_data = response.json()
+                contract_data = orjson.loads(response.content)
                 self.contract_ids.append(contract_data["id"])
                 response.success()
             else:
                 response.failure(f"Contract upload failed: {response.status_code}")
 
     @task(1)
+    @requires_auth
     def analyze_contract_direct(self):
         """Test direct contract analysis endpoint"""
-        if not self.auth_token:
-            return
-
-        pdf_content = self.get_sample_pdf_content()
-        filename = f"analysis_test_{random.randint(1000, 9999)}.pdf"
-
-        files = {
-            "file": (filename, io.BytesIO(pdf_content), "application/pdf")
-        }
-
         with self.client.post(
             "/api/v1/genai/analyze-contract",
-            files=files,
-            headers=self.auth_headers,
+            data=ANALYZE_BODY,
+            headers=self.upload_headers,
             catch_response=True
         ) as response:
             if response.status_code == 200:
@@ -252,11 +293,9 @@ startxref
                 response.failure(f"Direct analysis failed: {response.status_code}")
 
     @task(1)
+    @requires(lambda user: user.auth_token and user.contract_ids)
     def analyze_document_by_id(self):
         """Test document analysis by ID"""
-        if not self.auth_token or not self.contract_ids:
-            return
-
         contract_id = random.choice(self.contract_ids)
 
         with self.client.post(
@@ -273,23 +312,15 @@ startxref
                 response.failure(f"Document analysis failed: {response.status_code}")
 
     @task(2)
+    @requires_auth
     def get_metrics(self):
         """Test metrics endpoint"""
-        if not self.auth_token:
-            return
-
-        with self.client.get("/api/v1/metrics", headers=self.auth_headers, catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Metrics failed: {response.status_code}")
+        self.client.get("/api/v1/metrics", headers=self.auth_headers)
 
     @task(2)
+    @requires_auth
     def get_logs(self):
         """Test logs endpoint"""
-        if not self.auth_token:
-            return
-
         params = {
             "limit": 10,
             "skip": 0
@@ -302,16 +333,18 @@ startxref
                 response.failure(f"Logs failed: {response.status_code}")
 
 
-class AdminUser(HttpUser):
+class AdminUser(FastHttpUser):
     """
     Simulates an admin user performing administrative tasks
     """
     wait_time = between(2, 5)
+    concurrency = 50
     weight = 1  # Lower weight than regular users
 
     def on_start(self):
         """Setup admin user"""
         self.auth_token = None
+        self.auth_headers = {}
         self.admin_login()
 
     def admin_login(self):
@@ -322,28 +355,25 @@ class AdminUser(HttpUser):
             "password": "admin123"
         }
 
-        with self.client.post("/api/v1/auth/login", data=login_data, catch_response=True) as response:
+        with self.client.post(
+            "/api/v1/auth/login",
+            data=urlencode(login_data),
+            headers=FORM_HEADERS,
+            catch_response=True
+        ) as response:
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = orjson.loads(response.content)
                 self.auth_token = token_data["access_token"]
+                self.auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
                 response.success()
             else:
                 # Admin user might not exist in load test environment
                 response.success()
 
-    @property
-    def auth_headers(self):
-        """Get authorization headers"""
-        if not self.auth_token:
-            return {}
-        return {"Authorization": f"Bearer {self.auth_token}"}
-
     @task(3)
+    @requires_auth
     def admin_metrics(self):
         """Admin checks system metrics"""
-        if not self.auth_token:
-            return
-
         with self.client.get("/api/v1/metrics", headers=self.auth_headers, catch_response=True) as response:
             if response.status_code == 200:
                 response.success()
@@ -351,11 +381,9 @@ class AdminUser(HttpUser):
                 response.failure(f"Admin metrics failed: {response.status_code}")
 
     @task(3)
+    @requires_auth
     def admin_logs(self):
         """Admin checks system logs"""
-        if not self.auth_token:
-            return
-
         params = {
             "limit": 50,
             "skip": 0
@@ -0,0 +1,50 @@
+"""
+Shared request payload helpers for the Locust scenarios
+
+FastHttpSession has no ``files=`` support, so multipart bodies are built
+here. The boundary is fixed so the Content-Type header can be built once
+per user, and the PDF bytes are copied exactly once per request.
+
+``requires``/``requires_auth`` gate tasks on the user's login state.
+"""
+
+from functools import wraps
+from typing import Callable, Optional
+
+UPLOAD_BOUNDARY = "pwc-loadtest-boundary-7d1f2c"
+UPLOAD_CONTENT_TYPE = f"multipart/form-data; boundary={UPLOAD_BOUNDARY}"
+
+_CLOSING = f"\r\n--{UPLOAD_BOUNDARY}--\r\n".encode()
+
+
+def encode_upload(filename: str, pdf_content: bytes, client_id: Optional[str] = None) -> bytes:
+    """Encode a PDF upload (plus optional client_id field) as multipart/form-data"""
+    head = (
+        f"--{UPLOAD_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: application/pdf\r\n\r\n"
+    ).encode()
+
+    if client_id is None:
+        return b"".join((head, pdf_content, _CLOSING))
+
+    tail = (
+        f"\r\n--{UPLOAD_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="client_id"\r\n\r\n'
+        f"{client_id}\r\n--{UPLOAD_BOUNDARY}--\r\n"
+    ).encode()
+    return b"".join((head, pdf_content, tail))
+
+
+def requires(check: Callable) -> Callable:
+    """Skip a task unless ``check(user)`` is truthy (e.g. the user is logged in)"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if check(self):
+                return fn(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+requires_auth = requires(lambda user: user.auth_token)
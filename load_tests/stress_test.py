@@ -5,23 +5,56 @@ This script provides pre-configured stress test scenarios
 for different load patterns.
 """
 
-from locust import HttpUser, task, between, constant
-import json
+from locust import task, between, constant
+from locust.contrib.fasthttp import FastHttpUser
+from urllib.parse import urlencode
+import itertools
+import orjson
 import random
-import io
 
+from payloads import UPLOAD_CONTENT_TYPE, encode_upload, requires
 
-class HighVolumeUploadUser(HttpUser):
+# FastHttpSession sends ``data`` verbatim, so form bodies are encoded up front
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Stress PDFs in 10KB buckets between 10-100KB, built once at import
+STRESS_PDFS = [
+    b"%PDF-1.4\n" + b"X" * (size_kb * 1024 - 10) + b"\n%%EOF"
+    for size_kb in range(10, 101, 10)
+]
+
+
+def _ready(user):
+    """Run the user's deferred setup, then report whether it is logged in"""
+    user._ensure_setup()
+    return user.auth_token
+
+
+def _ready_with_client(user):
+    return _ready(user) and user.client_id
+
+
+class HighVolumeUploadUser(FastHttpUser):
     """
     Stress test focused on high-volume contract uploads
     """
     wait_time = constant(1)  # Constant 1 second wait for stress testing
+    concurrency = 50
 
     def on_start(self):
         """Setup for high volume testing"""
         self.auth_token = None
+        self.auth_headers = {}
         self.user_id = f"stress_user_{random.randint(10000, 99999)}"
         self.client_id = None
+        self._seq = itertools.count()
+        self._setup_done = False
+
+    def _ensure_setup(self):
+        """Run setup_user on the first task so spawning is not gated on it"""
+        if self._setup_done:
+            return
+        self._setup_done = True
         self.setup_user()
 
     def setup_user(self):
@@ -41,9 +74,11 @@ class HighVolumeUploadUser(HttpUser):
             "password": user_data["password"]
         }
 
-        response = self.client.post("/api/v1/auth/login", data=login_data)
+        response = self.client.post("/api/v1/auth/login", data=urlencode(login_data), headers=FORM_HEADERS)
         if response.status_code == 200:
-            self.auth_token = response.json()["access_token"]
+            self.auth_token = orjson.loads(response.content)["access_token"]
+            self.auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
+            self.upload_headers = {**self.auth_headers, "Content-Type": UPLOAD_CONTENT_TYPE}
 
         # Create client
         if self.auth_token:
@@ -51,47 +86,46 @@ class HighVolumeUploadUser(HttpUser):
                 "name": f"Stress Client {self.user_id}",
                 "company": "Stress Test Corp"
             }
-            headers = {"Authorization": f"Bearer {self.auth_token}"}
-            response = self.client.post("/api/v1/clients/", json=client_data, headers=headers)
+            response = self.client.post("/api/v1/clients/", json=client_data, headers=self.auth_headers)
             if response.status_code == 200:
-                self.client_id = response.json()["id"]
+                self.client_id = orjson.loads(response.content)["id"]
 
     def get_stress_pdf_content(self):
-        """Generate PDF content for stress testing"""
-        size_kb = random.randint(10, 100)  # Random size between 10-100KB
-        content = b"%PDF-1.4\n" + b"X" * (size_kb * 1024 - 10) + b"\n%%EOF"
-        return content
+        """Pick one of the pre-built stress PDFs (10-100KB)"""
+        return random.choice(STRESS_PDFS)
 
     @task(10)
+    @requires(_ready_with_client)
     def rapid_contract_upload(self):
         """Rapid contract uploads for stress testing"""
-        if not self.auth_token or not self.client_id:
-            return
-
         pdf_content = self.get_stress_pdf_content()
-        filename = f"stress_contract_{random.randint(100000, 999999)}.pdf"
+        filename = f"stress_contract_{next(self._seq)}.pdf"
 
-        files = {
-            "file": (filename, io.BytesIO(pdf_content), "application/pdf")
-        }
-        data = {
-            "client_id": self.client_id
-        }
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
+        body = encode_upload(filename, pdf_content, self.client_id)
 
-        self.client.post("/api/v1/contracts/", files=files, data=data, headers=headers)
+        self.client.post("/api/v1/contracts/", data=body, headers=self.upload_headers)
 
 
-class ConcurrentAnalysisUser(HttpUser):
+class ConcurrentAnalysisUser(FastHttpUser):
     """
     Stress test focused on concurrent analysis requests
     """
     wait_time = between(0.5, 1.5)
+    concurrency = 50
 
     def on_start(self):
         """Setup for concurrent analysis testing"""
         self.auth_token = None
+        self.auth_headers = {}
         self.user_id = f"analysis_user_{random.randint(10000, 99999)}"
+        self._seq = itertools.count()
+        self._setup_done = False
+
+    def _ensure_setup(self):
+        """Run setup_user on the first task so spawning is not gated on it"""
+        if self._setup_done:
+            return
+        self._setup_done = True
         self.setup_user()
 
     def setup_user(self):
@@ -109,9 +143,11 @@ class ConcurrentAnalysisUser(HttpUser):
             "password": user_data["password"]
         }
 
-        response = self.client.post("/api/v1/auth/login", data=login_data)
+        response = self.client.post("/api/v1/auth/login", data=urlencode(login_data), headers=FORM_HEADERS)
         if response.status_code == 200:
-            self.auth_token = response.json()["access_token"]
+            self.auth_token = orjson.loads(response.content)["access_token"]
+            self.auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
+            self.upload_headers = {**self.auth_headers, "Content-Type": UPLOAD_CONTENT_TYPE}
 
     def get_analysis_pdf_content(self):
         """Generate PDF with contract-like content for analysis"""
@@ -184,27 +220,20 @@ trailer
         return pdf_content
 
     @task(8)
+    @requires(_ready)
     def concurrent_direct_analysis(self):
         """Concurrent direct analysis requests"""
-        if not self.auth_token:
-            return
-
         pdf_content = self.get_analysis_pdf_content()
-        filename = f"analysis_stress_{random.randint(100000, 999999)}.pdf"
+        filename = f"analysis_stress_{next(self._seq)}.pdf"
 
-        files = {
-            "file": (filename, io.BytesIO(pdf_content), "application/pdf")
-        }
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
+        body = encode_upload(filename, pdf_content)
 
-        self.client.post("/api/v1/genai/analyze-contract", files=files, headers=headers)
+        self.client.post("/api/v1/genai/analyze-contract", data=body, headers=self.upload_headers)
 
     @task(2)
+    @requires(_ready)
     def evaluation_stress(self):
         """Stress test evaluation with direct clauses"""
-        if not self.auth_token:
-            return
-
         clauses_data = {
             "clauses": [
                 {
@@ -225,20 +254,28 @@ trailer
             ]
         }
 
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
-        self.client.post("/api/v1/genai/evaluate-clauses", json=clauses_data, headers=headers)
+        self.client.post("/api/v1/genai/evaluate-clauses", json=clauses_data, headers=self.auth_headers)
 
 
-class DatabaseStressUser(HttpUser):
+class DatabaseStressUser(FastHttpUser):
     """
     Stress test focused on database operations
     """
     wait_time = constant(0.5)
+    concurrency = 50
 
     def on_start(self):
         """Setup for database stress testing"""
         self.auth_token = None
+        self.auth_headers = {}
         self.user_id = f"db_user_{random.randint(10000, 99999)}"
+        self._setup_done = False
+
+    def _ensure_setup(self):
+        """Run setup_user on the first task so spawning is not gated on it"""
+        if self._setup_done:
+            return
+        self._setup_done = True
         self.setup_user()
 
     def setup_user(self):
@@ -256,18 +293,15 @@ class DatabaseStressUser(HttpUser):
             "password": user_data["password"]
         }
 
-        response = self.client.post("/api/v1/auth/login", data=login_data)
+        response = self.client.post("/api/v1/auth/login", data=urlencode(login_data), headers=FORM_HEADERS)
         if response.status_code == 200:
-            self.auth_token = response.json()["access_token"]
+            self.auth_token = orjson.loads(response.content)["access_token"]
+            self.auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
 
     @task(15)
+    @requires(_ready)
     def rapid_list_requests(self):
         """Rapid listing requests to stress database"""
-        if not self.auth_token:
-            return
-
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
-
         endpoints = [
             "/api/v1/contracts/",
             "/api/v1/clients/",
@@ -276,21 +310,18 @@ class DatabaseStressUser(HttpUser):
         ]
 
         endpoint = random.choice(endpoints)
-        self.client.get(endpoint, headers=headers)
+        self.client.get(endpoint, headers=self.auth_headers)
 
     @task(5)
+    @requires(_ready)
     def pagination_stress(self):
         """Stress test pagination"""
-        if not self.auth_token:
-            return
-
-        headers = {"Authorization": f"Bearer {self.auth_token}"}
         params = {
             "skip": random.randint(0, 100),
             "limit": random.randint(10, 100)
         }
 
-        self.client.get("/api/v1/contracts/", params=params, headers=headers)
+        self.client.get("/api/v1/contracts/", params=params, headers=self.auth_headers)
 
 
 # Load distribution for stress testing
@@ -1,29 +1,49 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
-from pydantic import BaseModel
+from typing import Dict, Any, List, Tuple, Union
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+# Results are built once from provider output and never mutated afterwards
+RESULT_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class ParsedDocument(BaseModel):
+    model_config = RESULT_MODEL_CONFIG
+
     text: str
     page_count: int = 0
     metadata: Dict[str, Any] = {}
 
 
 class ContractClause(BaseModel):
+    model_config = RESULT_MODEL_CONFIG
+
     type: str
     content: str
     confidence: float = 1.0
 
 
 class ContractAnalysisResult(BaseModel):
+    model_config = RESULT_MODEL_CONFIG
+
     clauses: List[ContractClause]
     metadata: Dict[str, Any] = {}
+    summary: str = ""
 
 
 class ContractEvaluationResult(BaseModel):
+    model_config = RESULT_MODEL_CONFIG
+
     approved: bool
     reasoning: str
     score: float = 0.0
+    recommendations: List[str] = []
+    critical_issues: List[str] = []
+
+
+# Validates a whole list of clause dicts in one pydantic-core call
+CLAUSE_LIST_ADAPTER = TypeAdapter(List[ContractClause])
 
 
 class AIInterface(ABC):
@@ -37,4 +57,31 @@ class AIInterface(ABC):
     @abstractmethod
     async def evaluate_contract(self, clauses: List[ContractClause]) -> ContractEvaluationResult:
         """Evaluate contract health based on clauses"""
+        pass
+
+    async def analyze_and_evaluate_batch(
+        self,
+        contract_texts: List[str],
+        max_concurrency: int = 16
+    ) -> List[Union[Tuple[ContractAnalysisResult, ContractEvaluationResult], Exception]]:
+        """Analyze then evaluate many contracts concurrently, in input order
+
+        A contract that fails gets its exception in its slot; the other
+        contracts still run to completion and keep their results.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(contract_text: str):
+            async with semaphore:
+                analysis = await self.analyze_contract(contract_text)
+                evaluation = await self.evaluate_contract(analysis.clauses)
+                return analysis, evaluation
+
+        return await asyncio.gather(
+            *(run_one(text) for text in contract_texts),
+            return_exceptions=True
+        )
+
+    async def aclose(self):
+        """Release network resources held by the client"""
         pass
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Type
 from .base import AIInterface
 from .openai_client import OpenAIClient
@@ -13,17 +14,42 @@ class AIFactory:
 
     @classmethod
     def create_client(cls, ai_provider: str, **kwargs) -> AIInterface:
-        """Create AI client instance based on provider type"""
+        """Create AI client instance based on provider type
+
+        Clients are memoized per provider, arguments and event loop so callers
+        share one connection pool instead of building a new one per request.
+        """
         if ai_provider not in cls._ai_classes:
             raise ValueError(
                 f"Unknown AI provider: {ai_provider}. "
                 f"Available providers: {list(cls._ai_classes.keys())}"
             )
 
-        ai_class = cls._ai_classes[ai_provider]
-        return ai_class(**kwargs)
+        # Pooled connections are bound to the loop that opened them
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        key = (ai_provider, loop, tuple(sorted(kwargs.items())))
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = cls._ai_classes[ai_provider](**kwargs)
+        return client
 
     @classmethod
     def register_provider(cls, name: str, ai_class: Type[AIInterface]):
         """Register a new AI provider implementation"""
-        cls._ai_classes[name] = ai_class
\ No newline at end of file
+        cls._ai_classes[name] = ai_class
+        _clients.clear()
+
+    @classmethod
+    async def aclose_clients(cls):
+        """Close and forget the memoized clients bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in _clients if key[1] is loop]:
+            await _clients.pop(key).aclose()
+
+
+# Memoized clients keyed by (provider, event loop, sorted kwargs)
+_clients: Dict[tuple, AIInterface] = {}
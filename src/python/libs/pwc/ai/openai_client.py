@@ -1,51 +1,98 @@
-import json
-from typing import List, Dict, Any
+import orjson
+from typing import List, Dict, Any, Optional
+import httpx
 from openai import AsyncOpenAI
 
-from .base import AIInterface, ContractClause, ContractAnalysisResult, ContractEvaluationResult
+from .base import (
+    AIInterface,
+    ContractClause,
+    ContractAnalysisResult,
+    ContractEvaluationResult,
+    CLAUSE_LIST_ADAPTER
+)
+
+# System messages never change, so requests share these dicts
+ANALYZE_SYSTEM_MESSAGE = {"role": "system", "content": "You are a legal expert analyzing contracts."}
+EVALUATE_SYSTEM_MESSAGE = {"role": "system", "content": "You are a legal expert evaluating contract risk."}
+
+# Prompt bodies are built once at import and filled per request with str.format
+ANALYZE_PROMPT_TEMPLATE = """
+Analyze the following contract and extract key clauses.
+Classify each clause by type (e.g., payment_terms, liability, termination, etc.).
+Return the result as a JSON object with the following structure:
+{{
+    "clauses": [
+        {{
+            "type": "clause_type",
+            "content": "clause_content",
+            "confidence": "confidence_score (0.0-1.0)"
+        }}
+    ],
+    "metadata": {{
+        "total_clauses": 5,
+        "contract_type": "service_agreement"
+    }}
+}}
+
+Contract text:
+{contract_text}
+"""
+
+EVALUATE_PROMPT_TEMPLATE = """
+Evaluate the following contract clauses and determine if the contract should be approved.
+Consider factors like completeness, risk level, and compliance.
+Return a JSON response with this structure:
+{{
+    "approved": true/false,
+    "reasoning": "Explanation of the decision",
+    "score": 0.85
+}}
+
+Contract clauses:
+{clauses_text}
+"""
 
 
 class OpenAIClient(AIInterface):
     """OpenAI implementation for contract analysis"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        max_connections: int = 500,
+        max_keepalive: int = 500,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        # A caller-supplied client lets several AI clients share one pool
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive,
+                    keepalive_expiry=60.0
+                ),
+                timeout=httpx.Timeout(600.0, connect=5.0)
+            )
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         self.model = model
 
+    async def aclose(self):
+        """Close the pooled HTTP connections"""
+        await self.client.close()
+
     async def analyze_contract(self, contract_text: str) -> ContractAnalysisResult:
         """Analyze contract PDF and extract clauses using OpenAI"""
 
         # Note: For now, we'll simulate PDF text extraction
         # In production, you'd use a PDF parser like PyPDF2 or pdfplumber
 
-        prompt = f"""
-        Analyze the following contract and extract key clauses.
-        Classify each clause by type (e.g., payment_terms, liability, termination, etc.).
-        Return the result as a JSON object with the following structure:
-        {{
-            "clauses": [
-                {{
-                    "type": "clause_type",
-                    "content": "clause_content",
-                    "confidence": "confidence_score (0.0-1.0)"
-                }}
-            ],
-            "metadata": {{
-                "total_clauses": 5,
-                "contract_type": "service_agreement"
-            }}
-        }}
-
-        Contract text:
-        {contract_text}
-        """
+        prompt = ANALYZE_PROMPT_TEMPLATE.format(contract_text=contract_text)
 
         response = await self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a legal expert analyzing contracts."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=[ANALYZE_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
             temperature=0.1
         )
 
@@ -61,15 +108,16 @@ class OpenAIClient(AIInterface):
                 end = content.find("```", start)
                 content = content[start:end].strip()
 
-            result_data = json.loads(content)
+            result_data = orjson.loads(content)
 
 
-            clauses = [ContractClause(**clause) for clause in result_data["clauses"]]
+            clauses = CLAUSE_LIST_ADAPTER.validate_python(result_data["clauses"])
             return ContractAnalysisResult(
                 clauses=clauses,
-                metadata=result_data.get("metadata", {})
+                metadata=result_data.get("metadata", {}),
+                summary=result_data.get("summary", "")
             )
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             # Fallback response
             return ContractAnalysisResult(
                 clauses=[
@@ -87,31 +135,15 @@ class OpenAIClient(AIInterface):
 
         clauses_text = "\n".join([f"- {clause.type}: {clause.content}" for clause in clauses])
 
-        prompt = f"""
-        Evaluate the following contract clauses and determine if the contract should be approved.
-        Consider factors like completeness, risk level, and compliance.
-        Return a JSON response with this structure:
-        {{
-            "approved": true/false,
-            "reasoning": "Explanation of the decision",
-            "score": 0.85
-        }}
-
-        Contract clauses:
-        {clauses_text}
-        """
+        prompt = EVALUATE_PROMPT_TEMPLATE.format(clauses_text=clauses_text)
 
         response = await self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a legal expert evaluating contract risk."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=[EVALUATE_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
             temperature=0.1
         )
 
         try:
-            print("response: of the model", response)
             content = response.choices[0].message.content
 
             # Extract JSON from markdown code blocks if present
@@ -124,13 +156,15 @@ class OpenAIClient(AIInterface):
                 end = content.find("```", start)
                 content = content[start:end].strip()
 
-            result_data = json.loads(content)
+            result_data = orjson.loads(content)
             return ContractEvaluationResult(
                 approved=result_data["approved"],
                 reasoning=result_data["reasoning"],
-                score=result_data.get("score", 0.0)
+                score=result_data.get("score", 0.0),
+                recommendations=result_data.get("recommendations", []),
+                critical_issues=result_data.get("critical_issues", [])
             )
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             # Fallback response
             return ContractEvaluationResult(
                 approved=False,
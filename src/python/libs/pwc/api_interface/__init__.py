@@ -1,3 +1,4 @@
 from .client import APIClient
+from .direct import DirectWriteAPIClient, get_mongo_client, close_mongo_clients
 
-__all__ = ["APIClient"]
\ No newline at end of file
+__all__ = ["APIClient", "DirectWriteAPIClient", "get_mongo_client", "close_mongo_clients"]
\ No newline at end of file
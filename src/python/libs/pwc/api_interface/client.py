@@ -1,9 +1,14 @@
+import gzip
 import httpx
+import orjson
 import asyncio
-from typing import Optional, Dict, Any
+import random
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple
 import logging
 from pathlib import Path
 
+from ..settings import settings
 from ..task_interface.schema import (
     ContractState,
     ContractAnalysisResult,
@@ -11,46 +16,195 @@ from ..task_interface.schema import (
     ContractProcessingStatus
 )
 
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+GZIP_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+# Result bodies above this size are gzipped; level 1 keeps most of the ratio at a fraction of the CPU
+GZIP_MIN_SIZE = 4096
+GZIP_LEVEL = 1
+
+# Retry policy for _make_request: exponential backoff with jitter
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 2.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Connection pools (HTTP client and in-flight limit) shared by every APIClient
+# on a loop, keyed by (base_url, event loop), see APIClient.get_shared. Tokens
+# are sent per request, so tasks with different tokens still share one pool.
+# The loop object itself is the key: a recreated loop may reuse a closed one's id().
+_SHARED_POOLS: Dict[Tuple[str, asyncio.AbstractEventLoop], Tuple[httpx.AsyncClient, asyncio.Semaphore]] = {}
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson instead of the stdlib decoder"""
+    return orjson.loads(response.content)
+
+
+def _json_body(body: bytes) -> Tuple[bytes, MappingProxyType]:
+    """Return the request body and headers, gzipping large JSON payloads"""
+    if len(body) > GZIP_MIN_SIZE:
+        return gzip.compress(body, compresslevel=GZIP_LEVEL), GZIP_JSON_HEADERS
+    return body, JSON_HEADERS
+
 
 class APIClient:
-    """HTTP client for workers to communicate with internal API endpoints"""
+    """HTTP client for workers to communicate with internal API endpoints
 
-    def __init__(self, base_url: str, auth_token: str, logger: Optional[logging.Logger] = None):
+    Pool limits should be tuned to roughly ``num_workers * concurrency`` so
+    concurrent tasks never block waiting for a free connection. HTTP/2 lets
+    the per-contract calls multiplex over one connection when the API is
+    served over TLS; plain ``http://`` URLs fall back to HTTP/1.1.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: str,
+        logger: Optional[logging.Logger] = None,
+        max_connections: int = 500,
+        max_keepalive: int = 500,
+        http2: bool = True,
+        max_in_flight: int = 8,
+        pool: Optional[Tuple[httpx.AsyncClient, asyncio.Semaphore]] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.auth_token = auth_token
+        self._auth_headers = MappingProxyType({"Authorization": f"Bearer {auth_token}"})
         self.logger = logger or logging.getLogger(__name__)
-        self._client = None
-
-    @property
-    def client(self):
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                headers={"Authorization": f"Bearer {self.auth_token}"},
-                timeout=30.0
-            )
-        return self._client
+        # A pool handed in by get_shared belongs to the registry, not to this client
+        self._owns_pool = pool is None
+        if pool is None:
+            pool = self._create_pool(self.base_url, max_connections, max_keepalive, http2, max_in_flight)
+        self.client, self._in_flight = pool
+
+    @staticmethod
+    def _create_pool(
+        base_url: str,
+        max_connections: int = 500,
+        max_keepalive: int = 500,
+        http2: bool = True,
+        max_in_flight: int = 8
+    ) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Build a pooled HTTP client and the semaphore capping its concurrent requests"""
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "User-Agent": f"pwc/{settings.app_version}",
+                # Brotli keeps get_contract's JSON bodies noticeably smaller than gzip
+                "Accept-Encoding": "br, gzip"
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=60.0
+            ),
+            http2=http2,
+            # Fail fast on an unreachable API instead of waiting the full read timeout
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+        # Caps concurrent requests so an overloaded API is not hit by a retry storm
+        return client, asyncio.Semaphore(max_in_flight)
+
+    @classmethod
+    def get_shared(
+        cls,
+        base_url: str,
+        auth_token: str,
+        logger: Optional[logging.Logger] = None
+    ) -> "APIClient":
+        """Return an APIClient using the connection pool shared on the current event loop
+
+        Pooled connections are bound to the loop that opened them, so each loop
+        gets its own pool; must be called from a running event loop. The
+        returned client only carries the task's token and per-task state, so
+        it need not be closed. Close the pools with ``aclose_shared``.
+        """
+        loop = asyncio.get_running_loop()
+        base_url = base_url.rstrip('/')
+        pool = _SHARED_POOLS.get((base_url, loop))
+        if pool is None:
+            # Forget pools of loops that have since been closed
+            for stale in [k for k in _SHARED_POOLS if k[1].is_closed()]:
+                del _SHARED_POOLS[stale]
+            pool = _SHARED_POOLS[(base_url, loop)] = cls._create_pool(base_url)
+        return cls(base_url, auth_token, logger=logger, pool=pool)
+
+    @staticmethod
+    async def aclose_shared():
+        """Close and forget every connection pool used by ``get_shared`` clients"""
+        pools = list(_SHARED_POOLS.values())
+        _SHARED_POOLS.clear()
+        for client, _ in pools:
+            await client.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool, unless it is shared"""
+        if self._owns_pool:
+            await self.client.aclose()
+
+    # Backwards compatible alias
+    close = aclose
 
-    async def close(self):
-        if self._client:
-            await self._client.aclose()
+    async def __aenter__(self) -> "APIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     def _get_url(self, path: str) -> str:
-        return f"{self.base_url}/api/v1/contracts/{path}"
+        return f"/api/v1/contracts/{path}"
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+        """Seconds to wait before the next attempt, honouring Retry-After when present
+
+        Retry-After is capped at RETRY_MAX_DELAY, so a long server-requested
+        pause cannot hold a worker task past its time limit.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass  # HTTP-date form, fall back to backoff
+        return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        idempotent: Optional[bool] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make HTTP request with error handling and retries
 
-    async def _make_request(self, method: str, path: str, **kwargs) -> httpx.Response:
-        """Make HTTP request with error handling and retries"""
+        Only transport errors and 429/5xx responses are retried. POSTs are not
+        retried unless ``idempotent=True`` or an ``Idempotency-Key`` header is sent.
+        """
         url = self._get_url(path)
+        headers = kwargs.get("headers")
+        if idempotent is None:
+            idempotent = method != "POST" or "Idempotency-Key" in (headers or {})
+        # The token is per client while the pool may be shared, so it goes on each request
+        kwargs["headers"] = {**headers, **self._auth_headers} if headers else self._auth_headers
 
-        for attempt in range(3):  # 3 retry attempts
+        for attempt in range(MAX_ATTEMPTS):
+            response = None
             try:
-                response = await self.client.request(method, url, **kwargs)
+                async with self._in_flight:
+                    response = await self.client.request(method, url, **kwargs)
                 response.raise_for_status()
                 return response
-            except Exception as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt == 2:  # Last attempt
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retryable = idempotent and (
+                    response is None or response.status_code in RETRYABLE_STATUS_CODES
+                )
+                if not retryable or attempt == MAX_ATTEMPTS - 1:
                     raise
-                await asyncio.sleep(1)  # Wait before retry
+                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(self._retry_delay(attempt, response))
 
     async def is_pipeline_latest(self, contract_id: str, run_id: str) -> bool:
         """Check if the pipeline run is the latest for this contract"""
@@ -59,15 +213,20 @@ class APIClient:
                 "GET",
                 f"{contract_id}/internal/pipeline/{run_id}/is-latest"
             )
-            return response.json().get("is_latest", False)
+            return _parse_json(response).get("is_latest", False)
         except Exception as e:
             self.logger.error(f"Failed to check pipeline status: {e}")
             return False
 
-    async def get_contract(self, contract_id: str) -> Dict[str, Any]:
-        """Get contract details"""
-        response = await self._make_request("GET", f"{contract_id}/internal")
-        return response.json()
+    async def get_contract(self, contract_id: str, projection: Optional[str] = None) -> Dict[str, Any]:
+        """Get contract details
+
+        ``projection`` names a field subset served by the API ("file",
+        "analysis"); by default the whole contract is returned.
+        """
+        params = {"projection": projection} if projection else None
+        response = await self._make_request("GET", f"{contract_id}/internal", params=params)
+        return _parse_json(response)
 
     async def update_contract_state(
         self,
@@ -93,10 +252,13 @@ class APIClient:
         result: ContractAnalysisResult
     ):
         """Save contract analysis result"""
+        content, headers = _json_body(result.model_dump_json().encode())
         await self._make_request(
             "POST",
             f"{contract_id}/internal/set-analysis-result",
-            json=result.dict()
+            idempotent=True,  # overwrites the stored result, safe to repeat
+            content=content,
+            headers=headers
         )
         self.logger.info(f"Saved analysis result for contract {contract_id}")
 
@@ -106,13 +268,48 @@ class APIClient:
         result: ContractEvaluationResult
     ):
         """Save contract evaluation result"""
+        content, headers = _json_body(result.model_dump_json().encode())
         await self._make_request(
             "POST",
             f"{contract_id}/internal/set-evaluation-result",
-            json=result.dict()
+            idempotent=True,  # overwrites the stored result, safe to repeat
+            content=content,
+            headers=headers
         )
         self.logger.info(f"Saved evaluation result for contract {contract_id}")
 
+    async def save_evaluation_and_transition(
+        self,
+        contract_id: str,
+        result: ContractEvaluationResult,
+        state: ContractState,
+        run_id: Optional[str] = None,
+        analysis: Optional[ContractAnalysisResult] = None
+    ):
+        """Save contract evaluation result and change state in one request
+
+        ``analysis`` is written in the same request when the analysis result
+        has not been saved yet.
+        """
+        payload = {
+            "result": result.model_dump(mode="json"),
+            "state": state.value,
+            "run_id": run_id
+        }
+        if analysis is not None:
+            payload["analysis_result"] = analysis.model_dump(mode="json")
+        content, headers = _json_body(orjson.dumps(payload))
+        await self._make_request(
+            "POST",
+            f"{contract_id}/internal/set-evaluation-result-and-state",
+            idempotent=True,  # overwrites the stored results and state, safe to repeat
+            content=content,
+            headers=headers
+        )
+        self.logger.info(
+            f"Saved evaluation result for contract {contract_id} and updated state to {state.value}"
+        )
+
     async def report_failure(
         self,
         contract_id: str,
@@ -123,14 +320,15 @@ class APIClient:
         await self._make_request(
             "PUT",
             f"{contract_id}/internal/failed",
-            json={"error_message": error_message, "error_type": error_type}
+            content=orjson.dumps({"error_message": error_message, "error_type": error_type}),
+            headers=JSON_HEADERS
         )
         self.logger.error(f"Reported failure for contract {contract_id}: {error_message}")
 
     async def ping(self) -> bool:
         """Health check for API connectivity"""
         try:
-            response = await self.client.get(f"{self.base_url}/healthz")
+            response = await self.client.get("/healthz")
             return response.status_code == 200
         except Exception:
             return False
\ No newline at end of file
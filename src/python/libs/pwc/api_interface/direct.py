@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from .client import APIClient
+from ..settings import settings
+from ..task_interface.schema import (
+    ContractState,
+    ContractAnalysisResult,
+    ContractEvaluationResult
+)
+
+CONTRACTS_COLLECTION = "contracts"
+
+# One Motor client per event loop, shared by every DirectWriteAPIClient on it,
+# so the MongoDB pool outlives the per-task clients instead of reconnecting
+# per contract.
+# Keyed by the loop object, not its id(), which a recreated loop may reuse.
+_MONGO_CLIENTS: Dict[asyncio.AbstractEventLoop, AsyncIOMotorClient] = {}
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """Return the Motor client for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    mongo = _MONGO_CLIENTS.get(loop)
+    if mongo is None:
+        mongo = _MONGO_CLIENTS[loop] = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.worker_mongodb_max_pool_size,
+            minPoolSize=settings.worker_mongodb_min_pool_size
+        )
+    return mongo
+
+
+def close_mongo_clients():
+    """Close and forget every Motor client handed out by ``get_mongo_client``"""
+    mongo_clients = list(_MONGO_CLIENTS.values())
+    _MONGO_CLIENTS.clear()
+    for mongo in mongo_clients:
+        mongo.close()
+
+
+class DirectWriteAPIClient(APIClient):
+    """APIClient that writes task results and state straight to MongoDB
+
+    Reads still go through the internal API; every write becomes a single
+    atomic ``update_one`` instead of an HTTP round trip to the API, which
+    would load the document, change it and save it back. Enabled with
+    ``USE_DIRECT_DB_WRITE``; the worker then needs ``MONGODB_URL`` too.
+    The MongoDB client is shared per event loop and is not closed by
+    ``aclose``; call ``close_mongo_clients`` at process shutdown.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.contracts = get_mongo_client()[settings.mongodb_database][CONTRACTS_COLLECTION]
+
+    async def _update_contract(self, contract_id: str, update: Dict[str, Any]):
+        """Apply an update to one contract, failing like the API does when it is missing"""
+        update.setdefault("$set", {})["updated_at"] = datetime.now(timezone.utc)
+        result = await self.contracts.update_one({"_id": ObjectId(contract_id)}, update)
+        if result.matched_count == 0:
+            raise ValueError(f"Contract not found: {contract_id}")
+
+    @staticmethod
+    def _state_update(state: ContractState, run_id: Optional[str]) -> Dict[str, Any]:
+        """Build the update the change-state endpoint applies"""
+        update: Dict[str, Any] = {"$set": {"status": state.value}}
+        if run_id:
+            update["$push"] = {"pipeline_runs": {
+                "run_id": run_id,
+                "state": state.value,
+                "timestamp": datetime.now(timezone.utc)
+            }}
+        return update
+
+    async def update_contract_state(
+        self,
+        contract_id: str,
+        state: ContractState,
+        run_id: Optional[str] = None
+    ):
+        """Update contract processing state"""
+        await self._update_contract(contract_id, self._state_update(state, run_id))
+        self.logger.info(f"Updated contract {contract_id} state to {state.value}")
+
+    async def save_analysis_result(
+        self,
+        contract_id: str,
+        result: ContractAnalysisResult
+    ):
+        """Save contract analysis result"""
+        await self._update_contract(contract_id, {"$set": {"analysis_result": result.model_dump()}})
+        self.logger.info(f"Saved analysis result for contract {contract_id}")
+
+    async def save_evaluation_result(
+        self,
+        contract_id: str,
+        result: ContractEvaluationResult
+    ):
+        """Save contract evaluation result"""
+        await self._update_contract(contract_id, {"$set": {"evaluation_result": result.model_dump()}})
+        self.logger.info(f"Saved evaluation result for contract {contract_id}")
+
+    async def save_evaluation_and_transition(
+        self,
+        contract_id: str,
+        result: ContractEvaluationResult,
+        state: ContractState,
+        run_id: Optional[str] = None,
+        analysis: Optional[ContractAnalysisResult] = None
+    ):
+        """Save contract evaluation (and analysis) result and change state in one update"""
+        update = self._state_update(state, run_id)
+        update["$set"]["evaluation_result"] = result.model_dump()
+        if analysis is not None:
+            update["$set"]["analysis_result"] = analysis.model_dump()
+        await self._update_contract(contract_id, update)
+        self.logger.info(
+            f"Saved evaluation result for contract {contract_id} and updated state to {state.value}"
+        )
+
+    async def report_failure(
+        self,
+        contract_id: str,
+        error_message: str,
+        error_type: str = "processing_error"
+    ):
+        """Report task failure"""
+        await self._update_contract(contract_id, {"$set": {
+            "status": ContractState.failed.value,
+            "error_message": error_message
+        }})
+        self.logger.error(f"Reported failure for contract {contract_id}: {error_message}")
\ No newline at end of file
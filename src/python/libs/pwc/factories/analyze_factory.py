@@ -5,42 +5,55 @@ import logging
 from pwc.ai import AIFactory
 from pwc.settings import settings
 
+_MODULE_LOGGER = logging.getLogger(__name__)
+
+# Settings are frozen, so hot-path values are read once at import
+_ANALYSIS_PROVIDER = settings.analysis_provider
+_API_KEY = settings.openai_api_key
+_MODEL = settings.openai_model
+
 
 class AnalyzeFactory:
     """Factory for analyzing contract clauses using AI client based on environment"""
 
+    @classmethod
+    def get_client(cls):
+        """Return the shared analysis AI client for the running event loop"""
+        return AIFactory.create_client(
+            _ANALYSIS_PROVIDER,
+            api_key=_API_KEY,
+            model=_MODEL
+        )
+
     @classmethod
     async def analyze(cls, document_text: str, logger: logging.Logger = None):
         """Analyze contract using AI client configured in environment"""
-        if logger is None:
-            logger = logging.getLogger(__name__)
+        logger = logger or _MODULE_LOGGER
 
-        logger.info(f"[ANALYZE INPUT] Starting contract analysis")
-        logger.info(f"[ANALYZE INPUT] Provider: {settings.analysis_provider}")
-        logger.info(f"[ANALYZE INPUT] Model: {settings.openai_model}")
-        logger.info(f"[ANALYZE INPUT] Text length: {len(document_text)} characters")
-        logger.debug(f"[ANALYZE INPUT] Text preview: {document_text[:500]}...")
+        logger.info("[ANALYZE INPUT] Starting contract analysis")
+        logger.info("[ANALYZE INPUT] Provider: %s", _ANALYSIS_PROVIDER)
+        logger.info("[ANALYZE INPUT] Model: %s", _MODEL)
+        logger.info("[ANALYZE INPUT] Text length: %s characters", len(document_text))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[ANALYZE INPUT] Text preview: %s...", document_text[:500])
 
         try:
             # Use AI factory to get the configured AI client
-            ai_client = AIFactory.create_client(
-                settings.analysis_provider,
-                api_key=settings.openai_api_key,
-                model=settings.openai_model
-            )
+            ai_client = cls.get_client()
 
-            logger.info(f"[ANALYZE] AI client created: {settings.analysis_provider}")
+            logger.info("[ANALYZE] AI client created: %s", _ANALYSIS_PROVIDER)
 
             # Call the analyze_contract method from the AI client
             result = await ai_client.analyze_contract(document_text)
 
-            logger.info(f"[ANALYZE OUTPUT] Analysis completed using {settings.analysis_provider}")
-            logger.info(f"[ANALYZE OUTPUT] Found {len(result.clauses)} clauses")
-            for i, clause in enumerate(result.clauses):
-                logger.debug(f"[ANALYZE OUTPUT] Clause {i+1}: {clause.type} (confidence: {clause.confidence})")
+            logger.info("[ANALYZE OUTPUT] Analysis completed using %s", _ANALYSIS_PROVIDER)
+            logger.info("[ANALYZE OUTPUT] Found %s clauses", len(result.clauses))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, clause in enumerate(result.clauses):
+                    logger.debug("[ANALYZE OUTPUT] Clause %d: %s (confidence: %s)", i + 1, clause.type, clause.confidence)
 
             return result
 
         except Exception as e:
-            logger.error(f"[ANALYZE ERROR] Contract analysis failed with {settings.analysis_provider}: {e}")
+            logger.error("[ANALYZE ERROR] Contract analysis failed with %s: %s", _ANALYSIS_PROVIDER, e)
             raise Exception(f"Analysis failed: {str(e)}")
\ No newline at end of file
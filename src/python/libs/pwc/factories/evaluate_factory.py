@@ -6,46 +6,57 @@ from typing import List
 from pwc.ai import AIFactory
 from pwc.settings import settings
 
+_MODULE_LOGGER = logging.getLogger(__name__)
+
+# Settings are frozen, so hot-path values are read once at import
+_EVALUATION_PROVIDER = settings.evaluation_provider
+_API_KEY = settings.openai_api_key
+_MODEL = settings.openai_model
+
 
 class EvaluateFactory:
     """Factory for evaluating contract health using AI client based on environment"""
 
+    @classmethod
+    def get_client(cls):
+        """Return the shared evaluation AI client for the running event loop"""
+        return AIFactory.create_client(
+            _EVALUATION_PROVIDER,
+            api_key=_API_KEY,
+            model=_MODEL
+        )
+
     @classmethod
     async def evaluate(cls, clauses: List, logger: logging.Logger = None):
         """Evaluate contract using AI client configured in environment"""
-        if logger is None:
-            logger = logging.getLogger(__name__)
+        logger = logger or _MODULE_LOGGER
 
-        logger.info(f"[EVALUATE INPUT] Starting contract evaluation")
-        logger.info(f"[EVALUATE INPUT] Provider: {settings.evaluation_provider}")
-        logger.info(f"[EVALUATE INPUT] Model: {settings.openai_model}")
-        logger.info(f"[EVALUATE INPUT] Number of clauses: {len(clauses)}")
+        logger.info("[EVALUATE INPUT] Starting contract evaluation")
+        logger.info("[EVALUATE INPUT] Provider: %s", _EVALUATION_PROVIDER)
+        logger.info("[EVALUATE INPUT] Model: %s", _MODEL)
+        logger.info("[EVALUATE INPUT] Number of clauses: %s", len(clauses))
 
-        for i, clause in enumerate(clauses):
-            logger.debug(f"[EVALUATE INPUT] Clause {i+1}: {clause.type} - {clause.content[:100]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, clause in enumerate(clauses):
+                logger.debug("[EVALUATE INPUT] Clause %d: %s - %s...", i + 1, clause.type, clause.content[:100])
 
         try:
             # Use AI factory to get the configured AI client
-            ai_client = AIFactory.create_client(
-                settings.evaluation_provider,
-                api_key=settings.openai_api_key,
-                model=settings.openai_model
-            )
+            ai_client = cls.get_client()
 
-            logger.info(f"[EVALUATE] AI client created: {settings.evaluation_provider}")
+            logger.info("[EVALUATE] AI client created: %s", _EVALUATION_PROVIDER)
 
             # Call the evaluate_contract method from the AI client
             result = await ai_client.evaluate_contract(clauses)
-            logger.info(f"[EVALUATE] AI evaluation completed", result)
-            logger.info(f"[EVALUATE OUTPUT] Evaluation completed using {settings.evaluation_provider}")
-            logger.info(f"[EVALUATE OUTPUT] Approved: {result.approved}")
-            logger.info(f"[EVALUATE OUTPUT] Score: {getattr(result, 'score', 'N/A')}")
-            logger.info(f"[EVALUATE OUTPUT] Recommendations: {len(getattr(result, 'recommendations', []))}")
-            logger.info(f"[EVALUATE OUTPUT] Critical issues: {len(getattr(result, 'critical_issues', []))}")
-            logger.debug(f"[EVALUATE OUTPUT] Reasoning: {result.reasoning}")
+            logger.info("[EVALUATE OUTPUT] Evaluation completed using %s", _EVALUATION_PROVIDER)
+            logger.info("[EVALUATE OUTPUT] Approved: %s", result.approved)
+            logger.info("[EVALUATE OUTPUT] Score: %s", result.score)
+            logger.info("[EVALUATE OUTPUT] Recommendations: %s", len(result.recommendations))
+            logger.info("[EVALUATE OUTPUT] Critical issues: %s", len(result.critical_issues))
+            logger.debug("[EVALUATE OUTPUT] Reasoning: %s", result.reasoning)
 
             return result
 
         except Exception as e:
-            logger.error(f"[EVALUATE ERROR] Contract evaluation failed with {settings.evaluation_provider}: {e}")
+            logger.error("[EVALUATE ERROR] Contract evaluation failed with %s: %s", _EVALUATION_PROVIDER, e)
             raise Exception(f"Evaluation failed: {str(e)}")
\ No newline at end of file
@@ -1,14 +1,22 @@
 """Factory for parsing contract documents using AI and libraries"""
 
+import asyncio
 import logging
 import tempfile
-import os
-from typing import Union
+from pathlib import Path
+from typing import Tuple, Union
 
 from pwc.ai.base import ParsedDocument
 from pwc.ai import AIFactory
 from pwc.settings import settings
 
+_MODULE_LOGGER = logging.getLogger(__name__)
+
+# Settings are frozen, so hot-path values are read once at import
+_PARSING_PROVIDER = settings.parsing_provider
+_API_KEY = settings.openai_api_key
+_MODEL = settings.openai_model
+
 
 class ParseFactory:
     """Factory for parsing contract documents with fallback to libraries"""
@@ -16,67 +24,122 @@ class ParseFactory:
     @classmethod
     async def parse(cls, file_content: bytes, filename: str, logger: logging.Logger = None) -> ParsedDocument:
         """Parse document using AI or fallback to library parsing"""
-        if logger is None:
-            logger = logging.getLogger(__name__)
+        logger = logger or _MODULE_LOGGER
 
-        logger.info(f"[PARSE INPUT] Starting document parsing for {filename}")
-        logger.info(f"[PARSE INPUT] File size: {len(file_content)} bytes")
-        logger.info(f"[PARSE INPUT] Provider: {settings.parsing_provider}")
+        logger.info("[PARSE INPUT] Starting document parsing for %s", filename)
+        logger.info("[PARSE INPUT] File size: %s bytes", len(file_content))
+        logger.info("[PARSE INPUT] Provider: %s", _PARSING_PROVIDER)
 
         # Try AI parsing first
-        if settings.parsing_provider != "library":
+        if _PARSING_PROVIDER != "library":
             try:
                 result = await cls._parse_with_ai(file_content, filename, logger)
-                logger.info(f"[PARSE OUTPUT] AI parsing successful - extracted {len(result.text)} characters from {result.page_count} pages")
+                logger.info("[PARSE OUTPUT] AI parsing successful - extracted %s characters from %s pages", len(result.text), result.page_count)
                 return result
             except Exception as e:
-                logger.warning(f"[PARSE ERROR] AI parsing failed, falling back to library: {e}")
+                logger.warning("[PARSE ERROR] AI parsing failed, falling back to library: %s", e)
 
         # Fallback to library parsing
         result = await cls._parse_with_library(file_content, filename, logger)
-        logger.info(f"[PARSE OUTPUT] Library parsing successful - extracted {len(result.text)} characters from {result.page_count} pages")
+        logger.info("[PARSE OUTPUT] Library parsing successful - extracted %s characters from %s pages", len(result.text), result.page_count)
         return result
 
     @classmethod
     async def _parse_with_ai(cls, file_content: bytes, filename: str, logger: logging.Logger) -> ParsedDocument:
         """Parse using AI provider"""
         ai_client = AIFactory.create_client(
-            settings.parsing_provider,
-            api_key=settings.openai_api_key,
-            model=settings.openai_model
+            _PARSING_PROVIDER,
+            api_key=_API_KEY,
+            model=_MODEL
         )
 
+        # Bail out before touching disk when the provider cannot parse documents
+        parse_document = getattr(ai_client, "parse_document", None)
+        if parse_document is None:
+            raise NotImplementedError(f"{type(ai_client).__name__} does not support document parsing")
+
         # Save file to temporary location for processing
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
             temp_file.write(file_content)
-            temp_file_path = temp_file.name
+            temp_file_path = Path(temp_file.name)
 
         try:
-            result = await ai_client.parse_document(temp_file_path, filename)
-            logger.info(f"AI parsing completed for {filename}")
+            result = await parse_document(str(temp_file_path), filename)
+            logger.info("AI parsing completed for %s", filename)
             return result
         finally:
-            os.unlink(temp_file_path)
+            temp_file_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _extract_with_pdfium(file_content: bytes) -> Tuple[str, int]:
+        """Extract text from every page with PDFium (C library, much faster than PyPDF2)"""
+        import pypdfium2 as pdfium
+
+        # PDFium is not thread-safe, so pages are read sequentially in one worker thread
+        pdf = pdfium.PdfDocument(file_content)
+        try:
+            parts = []
+            for page in pdf:
+                text_page = page.get_textpage()
+                parts.append(text_page.get_text_range())
+                text_page.close()
+                page.close()
+            return "\n".join(parts), len(parts)
+        finally:
+            pdf.close()
 
     @classmethod
     async def _parse_with_library(cls, file_content: bytes, filename: str, logger: logging.Logger) -> ParsedDocument:
-        """Parse using library (PyPDF2/pdfplumber)"""
+        """Parse using library (pypdfium2, falling back to PyPDF2)"""
+        try:
+            logger.info("[LIBRARY PARSE] Using pypdfium2 for %s", filename)
+
+            # Extraction is CPU-bound, keep it off the event loop
+            text, page_count = await asyncio.to_thread(cls._extract_with_pdfium, file_content)
+
+            result = ParsedDocument(
+                text=text.strip(),
+                page_count=page_count,
+                metadata={
+                    "parser": "pypdfium2",
+                    "filename": filename,
+                    "file_size": len(file_content)
+                }
+            )
+
+            logger.info("[LIBRARY PARSE] Completed for %s - total %s characters", filename, len(result.text))
+            return result
+
+        except ImportError:
+            logger.info("[LIBRARY PARSE] pypdfium2 not available, falling back to PyPDF2")
+        except Exception as e:
+            logger.error("[LIBRARY PARSE ERROR] Failed for %s: %s", filename, e)
+            raise Exception(f"Library parsing failed: {str(e)}")
+
+        return await cls._parse_with_pypdf2(file_content, filename, logger)
+
+    @classmethod
+    async def _parse_with_pypdf2(cls, file_content: bytes, filename: str, logger: logging.Logger) -> ParsedDocument:
+        """Parse using PyPDF2 (pure Python fallback)"""
         try:
             import PyPDF2
             import io
 
-            logger.info(f"[LIBRARY PARSE] Using PyPDF2 for {filename}")
+            logger.info("[LIBRARY PARSE] Using PyPDF2 for %s", filename)
 
             # Parse PDF using PyPDF2
             pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            logger.info(f"[LIBRARY PARSE] PDF loaded, pages: {len(pdf_reader.pages)}")
+            logger.info("[LIBRARY PARSE] PDF loaded, pages: %s", len(pdf_reader.pages))
 
-            # Extract text from all pages
-            text = ""
+            # Extract text from all pages, joined once instead of repeated concatenation
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            parts = []
             for i, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                text += page_text + "\n"
-                logger.debug(f"[LIBRARY PARSE] Page {i+1}: extracted {len(page_text)} characters")
+                page_text = page.extract_text() or ""
+                parts.append(page_text)
+                if debug_enabled:
+                    logger.debug("[LIBRARY PARSE] Page %d: extracted %d characters", i + 1, len(page_text))
+            text = "\n".join(parts)
 
             result = ParsedDocument(
                 text=text.strip(),
@@ -88,12 +151,12 @@ class ParseFactory:
                 }
             )
 
-            logger.info(f"[LIBRARY PARSE] Completed for {filename} - total {len(result.text)} characters")
+            logger.info("[LIBRARY PARSE] Completed for %s - total %s characters", filename, len(result.text))
             return result
 
         except ImportError as e:
-            logger.error(f"[LIBRARY PARSE ERROR] PyPDF2 not available: {e}")
+            logger.error("[LIBRARY PARSE ERROR] PyPDF2 not available: %s", e)
             raise Exception("PDF parsing library not available")
         except Exception as e:
-            logger.error(f"[LIBRARY PARSE ERROR] Failed for {filename}: {e}")
+            logger.error("[LIBRARY PARSE ERROR] Failed for %s: %s", filename, e)
             raise Exception(f"Library parsing failed: {str(e)}")
\ No newline at end of file
@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from typing import Optional, List
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
@@ -13,12 +14,18 @@ class Settings(BaseSettings):
     # API
     api_v1_prefix: str = "/api/v1"
     api_base_url: str = Field(default="http://api:8000")  # URL for worker callbacks
+    use_direct_db_write: bool = Field(default=False)  # workers write results to MongoDB, not via the API
     secret_key: str = Field(default="your-secret-key-change-this")
     access_token_expire_minutes: int = 30
 
     # Database
     mongodb_url: str = Field(default="mongodb://localhost:27017")
     mongodb_database: str = Field(default="pwc_contracts")
+    mongodb_max_pool_size: int = Field(default=100)
+    mongodb_min_pool_size: int = Field(default=10)
+    # Direct-write workers run one task per process, so each needs only a few connections
+    worker_mongodb_max_pool_size: int = Field(default=4)
+    worker_mongodb_min_pool_size: int = Field(default=0)
 
     # Redis/Celery
     redis_url: str = Field(default="redis://localhost:6379/0")
@@ -46,10 +53,18 @@ class Settings(BaseSettings):
     auth_username: str = Field(default="admin")
     auth_password: str = Field(default="admin123")
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the process-wide settings once; tests can call get_settings.cache_clear()"""
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
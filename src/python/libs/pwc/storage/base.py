@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Optional, Tuple
 from pathlib import Path
 
 
@@ -11,11 +11,20 @@ class StorageInterface(ABC):
         """Save content to storage and return the stored path"""
         pass
 
+    async def save_file(self, source: BinaryIO, file_path: str) -> Tuple[str, int]:
+        """Save the rest of a readable file object and return the stored path and its size"""
+        content = source.read()
+        return await self.save(content, file_path), len(content)
+
     @abstractmethod
     async def load(self, file_path: str) -> bytes:
         """Load content from storage"""
         pass
 
+    async def load_text(self, file_path: str, encoding: str = "utf-8") -> str:
+        """Load and decode a text file from storage"""
+        return (await self.load(file_path)).decode(encoding)
+
     @abstractmethod
     async def delete(self, file_path: str) -> bool:
         """Delete file from storage"""
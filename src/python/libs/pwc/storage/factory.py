@@ -1,6 +1,7 @@
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 from .base import StorageInterface
 from .local import LocalStorage
+from ..settings import settings
 
 
 class StorageFactory:
@@ -23,7 +24,24 @@ class StorageFactory:
         storage_class = cls._storage_classes[storage_type]
         return storage_class(**kwargs)
 
+    @classmethod
+    def get_storage(cls) -> StorageInterface:
+        """Return the storage configured in settings, created on first use and then shared"""
+        global _default_storage
+        if _default_storage is None:
+            _default_storage = cls.create_storage(
+                settings.storage_type,
+                base_path=settings.local_storage_path
+            )
+        return _default_storage
+
     @classmethod
     def register_storage(cls, name: str, storage_class: Type[StorageInterface]):
         """Register a new storage implementation"""
-        cls._storage_classes[name] = storage_class
\ No newline at end of file
+        global _default_storage
+        cls._storage_classes[name] = storage_class
+        _default_storage = None
+
+
+# Storage built from settings, see StorageFactory.get_storage
+_default_storage: Optional[StorageInterface] = None
\ No newline at end of file
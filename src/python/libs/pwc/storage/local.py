@@ -1,56 +1,102 @@
 import os
-import aiofiles
+import shutil
+import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Tuple
 
 from .base import StorageInterface
 
 
+# Uploads are copied to disk in chunks of this size instead of being read whole
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
 class LocalStorage(StorageInterface):
     """Local filesystem storage implementation"""
 
     def __init__(self, base_path: str = "./storage"):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Resolved once so per-file paths are plain string concatenation
+        self._base_str = str(self.base_path.resolve())
 
-    def _get_full_path(self, file_path: str) -> Path:
+    def _get_full_path(self, file_path: str) -> str:
         """Get full path for a file"""
-        return self.base_path / file_path.lstrip("/")
+        return self._base_str + os.sep + file_path.lstrip("/\\")
+
+    @staticmethod
+    def _write_file(full_path: str, content: bytes):
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(content)
+
+    @staticmethod
+    def _copy_file(source: BinaryIO, full_path: str) -> int:
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            shutil.copyfileobj(source, f, COPY_CHUNK_SIZE)
+            return f.tell()
+
+    @staticmethod
+    def _read_file(full_path: str) -> bytes:
+        with open(full_path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _read_text(full_path: str, encoding: str) -> str:
+        with open(full_path, "r", encoding=encoding, newline="") as f:
+            return f.read()
 
     async def save(self, content: bytes, file_path: str) -> str:
         """Save content to local filesystem"""
         full_path = self._get_full_path(file_path)
-        full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiofiles.open(full_path, "wb") as f:
-            await f.write(content)
+        # Whole files are written in one shot, so a single thread hop is enough
+        await asyncio.to_thread(self._write_file, full_path, content)
 
-        return str(full_path.relative_to(self.base_path))
+        return os.path.relpath(full_path, self._base_str)
+
+    async def save_file(self, source: BinaryIO, file_path: str) -> Tuple[str, int]:
+        """Copy a file object to the local filesystem chunk by chunk, in one thread hop"""
+        full_path = self._get_full_path(file_path)
+
+        size = await asyncio.to_thread(self._copy_file, source, full_path)
+
+        return os.path.relpath(full_path, self._base_str), size
 
     async def load(self, file_path: str) -> bytes:
         """Load content from local filesystem"""
         full_path = self._get_full_path(file_path)
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            return await asyncio.to_thread(self._read_file, full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    async def load_text(self, file_path: str, encoding: str = "utf-8") -> str:
+        """Load and decode a text file in the worker thread, never holding the raw bytes on the loop"""
+        full_path = self._get_full_path(file_path)
 
-        async with aiofiles.open(full_path, "rb") as f:
-            return await f.read()
+        try:
+            return await asyncio.to_thread(self._read_text, full_path, encoding)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
     async def delete(self, file_path: str) -> bool:
         """Delete file from local filesystem"""
         full_path = self._get_full_path(file_path)
 
-        if full_path.exists():
-            full_path.unlink()
+        try:
+            await asyncio.to_thread(os.remove, full_path)
             return True
-        return False
+        except FileNotFoundError:
+            return False
 
     async def exists(self, file_path: str) -> bool:
         """Check if file exists"""
         full_path = self._get_full_path(file_path)
-        return full_path.exists()
+        return await asyncio.to_thread(os.path.exists, full_path)
 
     def get_url(self, file_path: str) -> str:
         """Get file path for local storage"""
-        return str(self._get_full_path(file_path))
\ No newline at end of file
+        return self._get_full_path(file_path)
\ No newline at end of file
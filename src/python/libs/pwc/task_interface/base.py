@@ -1,15 +1,20 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from abc import ABC, abstractmethod
 import logging
 
-from pwc.api_interface import APIClient
+from pwc.api_interface import APIClient, DirectWriteAPIClient
+from pwc.settings import settings
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskInfo:
-    """Task execution context shared across all tasks"""
+    """Task execution context shared across all tasks
+
+    A plain slotted dataclass: built from the trusted task payload without
+    validation, and read on every log line and API call of a task.
+    """
     run_id: str
     contract_id: str
     storage_root_path: Path
@@ -46,13 +51,25 @@ class TaskExecutor(ABC):
 class ContractTaskExecutor(TaskExecutor):
     """Base class for contract-specific task executors"""
 
+    # Named field subset of the contract this executor reads, see APIClient.get_contract
+    contract_projection: Optional[str] = None
+
     def __init__(self, task_info: TaskInfo, logger: Optional[logging.Logger] = None):
         super().__init__(task_info, logger)
-        self.api = APIClient(
+        api_class = DirectWriteAPIClient if settings.use_direct_db_write else APIClient
+        self.api = api_class.get_shared(
             base_url=task_info.api_base_url,
             auth_token=task_info.api_auth_token,
             logger=self.logger
         )
+        # Filled by the first get_contract(), so a prefetch saves run() the request
+        self.contract: Optional[Dict[str, Any]] = None
+
+    async def get_contract(self) -> Dict[str, Any]:
+        """Return the contract already fetched for this task, or fetch it now"""
+        if self.contract is None:
+            self.contract = await self.api.get_contract(self.task_info.contract_id, self.contract_projection)
+        return self.contract
 
     async def start(self, *args, **kwargs):
         """Verify pipeline is latest before execution"""
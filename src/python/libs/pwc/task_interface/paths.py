@@ -0,0 +1,3 @@
+# Storage path templates shared by the pipeline steps, filled with
+# (contract_id, run_id)
+PARSED_TEXT_FMT = "parsed/{}/{}/text.txt"
\ No newline at end of file
@@ -0,0 +1,14 @@
+# Long AI/parsing steps and quick bookkeeping steps go to separate queues, so a
+# state change is never stuck behind a multi-minute analysis call that a worker
+# prefetched. Producer and worker must both route with these names.
+SLOW_QUEUE = "contracts.slow"
+FAST_QUEUE = "contracts.fast"
+
+TASK_ROUTES = {
+    "contract_analysis.run_pipeline": {"queue": SLOW_QUEUE},
+    "contract_analysis.parse_document": {"queue": SLOW_QUEUE},
+    "contract_analysis.analyze_clauses": {"queue": SLOW_QUEUE},
+    "contract_analysis.evaluate_health": {"queue": SLOW_QUEUE},
+    "contract_analysis.change_state": {"queue": FAST_QUEUE},
+    "contract_analysis.report_failure": {"queue": FAST_QUEUE},
+}
\ No newline at end of file
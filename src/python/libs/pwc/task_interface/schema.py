@@ -1,6 +1,10 @@
 from enum import Enum
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+# Task results are never mutated once built; freezing them makes that explicit
+RESULT_MODEL_CONFIG = ConfigDict(frozen=True)
 
 
 class ContractState(str, Enum):
@@ -31,6 +35,8 @@ class ClauseType(str, Enum):
 
 class ExtractedClause(BaseModel):
     """A single extracted clause from the contract"""
+    model_config = RESULT_MODEL_CONFIG
+
     type: str
     content: str
     confidence: float
@@ -40,6 +46,8 @@ class ExtractedClause(BaseModel):
 
 class ContractAnalysisResult(BaseModel):
     """Result of contract clause analysis"""
+    model_config = RESULT_MODEL_CONFIG
+
     clauses: List[ExtractedClause]
     metadata: Dict[str, Any]
     processing_time: float
@@ -48,6 +56,8 @@ class ContractAnalysisResult(BaseModel):
 
 class ContractEvaluationResult(BaseModel):
     """Result of contract health evaluation"""
+    model_config = RESULT_MODEL_CONFIG
+
     approved: bool
     reasoning: str
     risk_score: float
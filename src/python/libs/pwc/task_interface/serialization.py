@@ -0,0 +1,40 @@
+import orjson
+from kombu.serialization import register
+from pydantic import BaseModel
+
+ORJSON_SERIALIZER = "orjson"
+# Same content type as kombu's json serializer, so any JSON consumer can decode it
+ORJSON_CONTENT_TYPE = "application/json"
+
+
+def _default(obj):
+    """Embed pydantic models as JSON written by pydantic-core, skipping the intermediate dict"""
+    if isinstance(obj, BaseModel):
+        return orjson.Fragment(obj.model_dump_json())
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    """orjson.dumps that also accepts pydantic models, e.g. task results"""
+    return orjson.dumps(obj, default=_default)
+
+
+def register_orjson_serializer():
+    """Register an orjson-backed Celery/kombu serializer named ``orjson``
+
+    Task payloads are plain JSON (task_info dicts, state strings), so orjson
+    encodes the same wire format as the stdlib ``json`` serializer, only faster.
+    Messages keep the ``application/json`` content type: workers that have not
+    registered this serializer, Flower and other kombu consumers decode them
+    with their own JSON decoder, so producers and workers can be deployed in
+    any order. Registering also makes orjson the decoder for incoming JSON.
+    Task results may be pydantic models; they are encoded as if ``model_dump``
+    had been called.
+    """
+    register(
+        ORJSON_SERIALIZER,
+        dumps,
+        orjson.loads,
+        content_type=ORJSON_CONTENT_TYPE,
+        content_encoding="utf-8"
+    )
\ No newline at end of file
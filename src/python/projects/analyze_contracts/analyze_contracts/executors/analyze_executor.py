@@ -1,8 +1,11 @@
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List, Optional
 
 from pwc.task_interface.base import ContractTaskExecutor
-from pwc.task_interface.schema import ContractAnalysisResult, ExtractedClause, ClauseType
+from pwc.task_interface.paths import PARSED_TEXT_FMT
+from pwc.task_interface.schema import ContractAnalysisResult, ExtractedClause
 from pwc.factories import AnalyzeFactory
+from pwc.ai.base import ContractClause
 from pwc.storage import StorageFactory
 from pwc.settings import settings
 
@@ -10,23 +13,39 @@ from pwc.settings import settings
 class AnalyzeContractExecutor(ContractTaskExecutor):
     """Executor for contract clause analysis using AI-based factory"""
 
-    async def run(self, task_info_dict: Dict[str, Any]) -> ContractAnalysisResult:
-        """Analyze contract clauses using AI factory"""
-        self.logger.info(f"[EXECUTOR] Starting contract analysis for {self.task_info.contract_id}")
+    # AI-format clauses from the last run, handed straight to evaluation
+    # when both steps run in the same pipeline task
+    clauses: Optional[List[ContractClause]] = None
 
-        try:
-            # Initialize storage
-            storage = StorageFactory.create_storage(
-                settings.storage_type,
-                base_path=settings.local_storage_path
-            )
+    async def _load_text(self) -> str:
+        """Load the parsed text saved by the parsing step"""
+        storage = StorageFactory.get_storage()
+
+        text_file_path = PARSED_TEXT_FMT.format(self.task_info.contract_id, self.task_info.run_id)
+        self.logger.info("[EXECUTOR] Loading parsed text from: %s", text_file_path)
+        document_text = await storage.load_text(text_file_path)
+        self.logger.info("[EXECUTOR] Loaded text: %s characters", len(document_text))
+        return document_text
+
+    async def run(
+        self,
+        task_info_dict: Dict[str, Any],
+        persist: bool = True,
+        document_text: Optional[str] = None
+    ) -> ContractAnalysisResult:
+        """Analyze contract clauses using AI factory
 
-            # Load parsed text from previous parsing step
-            text_file_path = f"parsed/{self.task_info.contract_id}/{self.task_info.run_id}/text.txt"
-            self.logger.info(f"[EXECUTOR] Loading parsed text from: {text_file_path}")
-            text_content = await storage.load(text_file_path)
-            document_text = text_content.decode('utf-8')
-            self.logger.info(f"[EXECUTOR] Loaded text: {len(document_text)} characters")
+        With ``persist=False`` the result is returned without being saved, for
+        callers that write it together with the evaluation result. A
+        ``document_text`` already in memory skips reloading the parsed text.
+        """
+        self.logger.info("[EXECUTOR] Starting contract analysis for %s", self.task_info.contract_id)
+
+        start_ns = time.perf_counter_ns()
+
+        try:
+            if document_text is None:
+                document_text = await self._load_text()
 
             # Analyze contract using factory
             analysis_result = await AnalyzeFactory.analyze(
@@ -34,41 +53,44 @@ class AnalyzeContractExecutor(ContractTaskExecutor):
                 logger=self.logger
             )
 
-            # Convert to our schema format
+            self.clauses = analysis_result.clauses
+
+            # Convert to our schema format; AI clauses carry no page/section,
+            # so those keep their None defaults
             clauses = [
-                ExtractedClause(
+                ExtractedClause.model_construct(
                     type=clause.type,
                     content=clause.content,
-                    confidence=clause.confidence,
-                    page_number=getattr(clause, 'page_number', None),
-                    section=getattr(clause, 'section', None)
+                    confidence=clause.confidence
                 )
                 for clause in analysis_result.clauses
             ]
 
-            # Create final result
-            result = ContractAnalysisResult(
+            # Create final result; built from data we just produced, so pydantic
+            # validation is skipped (the API validates it again on ingress)
+            result = ContractAnalysisResult.model_construct(
                 clauses=clauses,
                 metadata={
                     "contract_id": self.task_info.contract_id,
                     "run_id": self.task_info.run_id,
-                    "summary": getattr(analysis_result, 'summary', ''),
+                    "summary": analysis_result.summary,
                     "ai_provider": settings.ai_provider,
                     "model_used": settings.openai_model
                 },
-                processing_time=0,  # TODO: Add timing
+                processing_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 model_used=settings.openai_model
             )
 
             # Save result via API
-            await self.api.save_analysis_result(self.task_info.contract_id, result)
+            if persist:
+                await self.api.save_analysis_result(self.task_info.contract_id, result)
 
-            self.logger.info(f"[EXECUTOR] Contract analysis completed for {self.task_info.contract_id}")
-            self.logger.info(f"[EXECUTOR] Result: {len(result.clauses)} clauses extracted")
+            self.logger.info("[EXECUTOR] Contract analysis completed for %s", self.task_info.contract_id)
+            self.logger.info("[EXECUTOR] Result: %s clauses extracted", len(result.clauses))
             return result
 
         except Exception as e:
-            self.logger.error(f"Contract analysis failed: {e}")
+            self.logger.error("Contract analysis failed: %s", e)
             await self.api.report_failure(
                 self.task_info.contract_id,
                 f"Analysis failed: {str(e)}",
@@ -1,41 +1,60 @@
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List, Optional
 
 from pwc.task_interface.base import ContractTaskExecutor
-from pwc.task_interface.schema import ContractEvaluationResult
+from pwc.task_interface.schema import ContractAnalysisResult, ContractEvaluationResult, ContractState
 from pwc.factories import EvaluateFactory
-from pwc.ai.base import ContractClause
+from pwc.ai.base import CLAUSE_LIST_ADAPTER, ContractClause
 from pwc.settings import settings
 
 
 class EvaluateContractExecutor(ContractTaskExecutor):
     """Executor for contract health evaluation using AI-based factory"""
 
-    async def run(self, task_info_dict: Dict[str, Any]) -> ContractEvaluationResult:
-        """Evaluate contract health using AI factory"""
-        self.logger.info(f"[EXECUTOR] Starting contract evaluation for {self.task_info.contract_id}")
+    # Only the stored analysis is read
+    contract_projection = "analysis"
+
+    async def _load_clauses(self) -> List[ContractClause]:
+        """Fetch the stored analysis result and convert it to AI client clauses"""
+        # Get contract with analysis results from API
+        self.logger.info("[EXECUTOR] Fetching contract with analysis results from API")
+        contract = await self.get_contract()
+        self.logger.info("[EXECUTOR] Contract loaded with analysis results")
+
+        # Extract clauses from analysis results
+        clauses_data = (contract.get("analysis_result") or {}).get("clauses")
+        if not clauses_data:
+            self.logger.error("[EXECUTOR] No analysis results found for contract %s", self.task_info.contract_id)
+            raise ValueError("No analysis results found. Contract must be analyzed first.")
+
+        # Convert to AI client format in one pydantic-core call; the stored
+        # clauses were validated as ExtractedClause on ingress, so every
+        # clause has type/content/confidence and page/section are ignored
+        return CLAUSE_LIST_ADAPTER.validate_python(clauses_data)
+
+    async def run(
+        self,
+        task_info_dict: Dict[str, Any],
+        clauses: Optional[List[ContractClause]] = None,
+        analysis: Optional[ContractAnalysisResult] = None
+    ) -> ContractEvaluationResult:
+        """Evaluate contract health using AI factory
+
+        ``clauses`` are the analyze step's in-memory clauses; when given, the
+        contract is not fetched back from the API to rebuild them. An unsaved
+        ``analysis`` result is persisted in the same write as the evaluation.
+        """
+        self.logger.info("[EXECUTOR] Starting contract evaluation for %s", self.task_info.contract_id)
+
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Get contract with analysis results from API
-            self.logger.info(f"[EXECUTOR] Fetching contract with analysis results from API")
-            contract = await self.api.get_contract(self.task_info.contract_id)
-            self.logger.info(f"[EXECUTOR] Contract loaded with analysis results")
-
-            # Extract clauses from analysis results
-            if not contract.get("analysis_result") or not contract["analysis_result"].get("clauses"):
-                self.logger.error(f"[EXECUTOR] No analysis results found for contract {self.task_info.contract_id}")
+            if clauses is None:
+                clauses = await self._load_clauses()
+            elif not clauses:
                 raise ValueError("No analysis results found. Contract must be analyzed first.")
 
-            self.logger.info(f"[EXECUTOR] Found {len(contract['analysis_result']['clauses'])} clauses to evaluate")
-
-            # Convert to AI client format (ContractClause objects)
-            clauses = [
-                ContractClause(
-                    type=clause.get("type", "unknown"),
-                    content=clause.get("content", ""),
-                    confidence=clause.get("confidence", 0.8)
-                )
-                for clause in contract["analysis_result"]["clauses"]
-            ]
+            self.logger.info("[EXECUTOR] Found %s clauses to evaluate", len(clauses))
 
             # Evaluate contract using factory
             evaluation_result = await EvaluateFactory.evaluate(
@@ -43,25 +62,32 @@ class EvaluateContractExecutor(ContractTaskExecutor):
                 logger=self.logger
             )
 
-            # Create final result
-            result = ContractEvaluationResult(
+            # Create final result; built from data we just produced, so pydantic
+            # validation is skipped (the API validates it again on ingress)
+            result = ContractEvaluationResult.model_construct(
                 approved=evaluation_result.approved,
-                risk_score=getattr(evaluation_result, 'score', 0.0),
+                risk_score=evaluation_result.score,
                 reasoning=evaluation_result.reasoning,
-                recommendations=getattr(evaluation_result, 'recommendations', []),
-                critical_issues=getattr(evaluation_result, 'critical_issues', []),
-                processing_time=0  # TODO: Add timing
+                recommendations=evaluation_result.recommendations,
+                critical_issues=evaluation_result.critical_issues,
+                processing_time=(time.perf_counter_ns() - start_ns) / 1e9
             )
 
-            # Save result via API
-            await self.api.save_evaluation_result(self.task_info.contract_id, result)
+            # Save result and finish the pipeline in one API call
+            await self.api.save_evaluation_and_transition(
+                self.task_info.contract_id,
+                result,
+                ContractState.completed,
+                self.task_info.run_id,
+                analysis=analysis
+            )
 
-            self.logger.info(f"[EXECUTOR] Contract evaluation completed for {self.task_info.contract_id}")
-            self.logger.info(f"[EXECUTOR] Result: approved={result.approved}, risk_score={result.risk_score}")
+            self.logger.info("[EXECUTOR] Contract evaluation completed for %s", self.task_info.contract_id)
+            self.logger.info("[EXECUTOR] Result: approved=%s, risk_score=%s", result.approved, result.risk_score)
             return result
 
         except Exception as e:
-            self.logger.error(f"Contract evaluation failed: {e}")
+            self.logger.error("Contract evaluation failed: %s", e)
             await self.api.report_failure(
                 self.task_info.contract_id,
                 f"Evaluation failed: {str(e)}",
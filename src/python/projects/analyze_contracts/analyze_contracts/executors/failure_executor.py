@@ -8,7 +8,7 @@ class ReportFailureExecutor(ContractTaskExecutor):
 
     async def run(self, error_message: str, task_info_dict: Dict[str, Any]) -> None:
         """Report contract processing failure via API"""
-        self.logger.error(f"Reporting failure for contract {self.task_info.contract_id}: {error_message}")
+        self.logger.error("Reporting failure for contract %s: %s", self.task_info.contract_id, error_message)
 
         try:
             # Report failure via API
@@ -18,8 +18,8 @@ class ReportFailureExecutor(ContractTaskExecutor):
                 "task_failure"
             )
 
-            self.logger.info(f"Successfully reported failure for contract {self.task_info.contract_id}")
+            self.logger.info("Successfully reported failure for contract %s", self.task_info.contract_id)
 
         except Exception as e:
-            self.logger.error(f"Failed to report failure: {e}")
+            self.logger.error("Failed to report failure: %s", e)
             # Don't raise here as this is already an error handler
\ No newline at end of file
@@ -1,34 +1,57 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional
 
 from pwc.task_interface.base import ContractTaskExecutor
+from pwc.task_interface.paths import PARSED_TEXT_FMT
 from pwc.factories import ParseFactory
 from pwc.storage import StorageFactory
-from pwc.settings import settings
 
 
 class ParseContractExecutor(ContractTaskExecutor):
     """Executor for parsing contract documents using AI-based factory"""
 
-    async def run(self, task_info_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse contract document and extract text"""
-        self.logger.info(f"[EXECUTOR] Starting contract parsing for {self.task_info.contract_id}")
+    # Parsed text from the last run, handed straight to analysis when both
+    # steps run in the same pipeline task
+    text: Optional[str] = None
+    saving: Optional[asyncio.Future] = None
 
+    # Only the file name and location are read
+    contract_projection = "file"
+
+    async def _save_text(self, storage, text: str, text_file_path: str):
+        """Save the parsed text, reporting a failure like the parse step itself"""
         try:
-            # Get contract details from API
-            self.logger.info(f"[EXECUTOR] Fetching contract details from API")
-            contract = await self.api.get_contract(self.task_info.contract_id)
-            self.logger.info(f"[EXECUTOR] Contract loaded: {contract.get('filename', 'unknown')}")
-
-            # Initialize storage
-            storage = StorageFactory.create_storage(
-                settings.storage_type,
-                base_path=settings.local_storage_path
+            await storage.save(text.encode('utf-8'), text_file_path)
+        except Exception as e:
+            self.logger.error("Saving parsed text failed: %s", e)
+            await self.api.report_failure(
+                self.task_info.contract_id,
+                f"Parsing failed: {str(e)}",
+                "parsing_error"
             )
+            raise
+
+    async def run(self, task_info_dict: Dict[str, Any], wait_for_save: bool = True) -> Dict[str, Any]:
+        """Parse contract document and extract text
+
+        With ``wait_for_save=False`` the parsed text is written in the
+        background and the caller must await ``self.saving`` before finishing.
+        """
+        self.logger.info("[EXECUTOR] Starting contract parsing for %s", self.task_info.contract_id)
+
+        try:
+            # Get contract details from API
+            self.logger.info("[EXECUTOR] Fetching contract details from API")
+            contract = await self.get_contract()
+            self.logger.info("[EXECUTOR] Contract loaded: %s", contract.get('filename', 'unknown'))
+
+            # Shared across tasks; created on first use
+            storage = StorageFactory.get_storage()
 
             # Load contract file
-            self.logger.info(f"[EXECUTOR] Loading file from: {contract['file_path']}")
+            self.logger.info("[EXECUTOR] Loading file from: %s", contract['file_path'])
             file_content = await storage.load(contract["file_path"])
-            self.logger.info(f"[EXECUTOR] File loaded: {len(file_content)} bytes")
+            self.logger.info("[EXECUTOR] File loaded: %s bytes", len(file_content))
 
             # Parse document using factory
             parsed_doc = await ParseFactory.parse(
@@ -37,9 +60,15 @@ class ParseContractExecutor(ContractTaskExecutor):
                 logger=self.logger
             )
 
+            self.text = parsed_doc.text
+
             # Save parsed text to storage
-            text_file_path = f"parsed/{self.task_info.contract_id}/{self.task_info.run_id}/text.txt"
-            await storage.save(parsed_doc.text.encode('utf-8'), text_file_path)
+            text_file_path = PARSED_TEXT_FMT.format(self.task_info.contract_id, self.task_info.run_id)
+            self.saving = asyncio.ensure_future(
+                self._save_text(storage, parsed_doc.text, text_file_path)
+            )
+            if wait_for_save:
+                await self.saving
 
             result = {
                 "contract_id": self.task_info.contract_id,
@@ -50,12 +79,12 @@ class ParseContractExecutor(ContractTaskExecutor):
                 "metadata": parsed_doc.metadata
             }
 
-            self.logger.info(f"[EXECUTOR] Contract parsing completed for {self.task_info.contract_id}")
-            self.logger.info(f"[EXECUTOR] Result: {result['page_count']} pages, {result['characters_extracted']} characters")
+            self.logger.info("[EXECUTOR] Contract parsing completed for %s", self.task_info.contract_id)
+            self.logger.info("[EXECUTOR] Result: %s pages, %s characters", result['page_count'], result['characters_extracted'])
             return result
 
         except Exception as e:
-            self.logger.error(f"Contract parsing failed: {e}")
+            self.logger.error("Contract parsing failed: %s", e)
             await self.api.report_failure(
                 self.task_info.contract_id,
                 f"Parsing failed: {str(e)}",
@@ -3,17 +3,22 @@ from typing import Dict, Any
 from pwc.task_interface.base import ContractTaskExecutor
 from pwc.task_interface.schema import ContractState
 
+# Plain dict lookup by state value, built once
+_STATES = {contract_state.value: contract_state for contract_state in ContractState}
+
 
 class ChangeStateExecutor(ContractTaskExecutor):
     """Executor for changing contract state"""
 
     async def run(self, state: str, task_info_dict: Dict[str, Any]) -> None:
         """Change contract state via API"""
-        self.logger.info(f"Changing contract {self.task_info.contract_id} state to {state}")
+        self.logger.info("Changing contract %s state to %s", self.task_info.contract_id, state)
 
         try:
             # Validate state
-            contract_state = ContractState(state)
+            contract_state = _STATES.get(state)
+            if contract_state is None:
+                raise ValueError(f"{state!r} is not a valid ContractState")
 
             # Update state via API
             await self.api.update_contract_state(
@@ -22,10 +27,10 @@ class ChangeStateExecutor(ContractTaskExecutor):
                 self.task_info.run_id
             )
 
-            self.logger.info(f"Successfully changed contract state to {state}")
+            self.logger.info("Successfully changed contract state to %s", state)
 
         except Exception as e:
-            self.logger.error(f"Failed to change contract state: {e}")
+            self.logger.error("Failed to change contract state: %s", e)
             await self.api.report_failure(
                 self.task_info.contract_id,
                 f"State change failed: {str(e)}",
@@ -1,16 +1,16 @@
-import sys
-import os
-from pathlib import Path
-
-# Add the shared library to the Python path
-current_dir = Path(__file__).parent
-libs_path = current_dir.parent.parent.parent / "libs"
-sys.path.insert(0, str(libs_path))
-
+import asyncio
+import threading
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from pwc.settings import settings
 from pwc.logger import setup_logger
 from pwc.task_interface.base import TaskInfo
+from pwc.task_interface.schema import ContractState
+from pwc.task_interface.serialization import ORJSON_SERIALIZER, register_orjson_serializer
+from pwc.task_interface.routing import TASK_ROUTES
+from pwc.api_interface import APIClient, get_mongo_client, close_mongo_clients
+from pwc.ai import AIFactory
+from pwc.factories import AnalyzeFactory, EvaluateFactory
 
 # Import task registry and executors
 from .task_registry import task_registry
@@ -24,6 +24,18 @@ from .executors import (
 
 logger = setup_logger(__name__)
 
+# Worker loops run on libuv when uvloop is available; created directly rather
+# than through the event loop policy, which newer Pythons deprecate
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    logger.info("uvloop not installed, using the default asyncio event loop")
+    _new_event_loop = asyncio.new_event_loop
+
+# Task bodies and results are encoded with orjson instead of the stdlib json module
+register_orjson_serializer()
+
 # Create Celery app
 celery_app = Celery(
     "pwc_contract_analysis_worker",
@@ -33,14 +45,20 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer=ORJSON_SERIALIZER,
+    accept_content=["json", ORJSON_SERIALIZER],
+    result_serializer=ORJSON_SERIALIZER,
+    # Analysis/evaluation results carry full clause text; compress them in the backend
+    result_compression="gzip",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    task_routes=TASK_ROUTES,
+    # Ack after the task finishes so a crashed worker's task is redelivered
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
     worker_log_format="[%(asctime)s: %(levelname)s/%(processName)s] %(message)s",
@@ -48,6 +66,76 @@ celery_app.conf.update(
 )
 
 
+# One event loop per worker process, running in a background thread, so shared
+# API/AI clients keep their connection pools across tasks instead of being
+# rebuilt for every task. Task threads submit coroutines to it and wait.
+_worker_loop = None
+_worker_loop_thread = None
+_worker_loop_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's running event loop, starting it on first use"""
+    global _worker_loop, _worker_loop_thread
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            _worker_loop = _new_event_loop()
+            _worker_loop_thread = threading.Thread(
+                target=_worker_loop.run_forever,
+                name="worker-event-loop",
+                daemon=True
+            )
+            _worker_loop_thread.start()
+    return _worker_loop
+
+
+def run_in_worker_loop(coro):
+    """Run a coroutine on the process loop and block the calling task until it finishes"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_worker_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. SoftTimeLimitExceeded raised in the waiting task thread
+        future.cancel()
+        raise
+
+
+async def _execute(task_name: str, task_info_dict, *args):
+    """Build the executor on the loop, so its shared clients bind to it, and run it"""
+    executor = task_registry.get_executor(task_name, TaskInfo(**task_info_dict))
+    return await executor.run(*args, task_info_dict)
+
+
+async def _create_ai_clients():
+    AnalyzeFactory.get_client()
+    EvaluateFactory.get_client()
+    if settings.use_direct_db_write:
+        get_mongo_client()
+
+
+@worker_process_init.connect
+def warm_worker_clients(**kwargs):
+    """Start the process loop and build its shared AI and MongoDB clients before the first task"""
+    try:
+        run_in_worker_loop(_create_ai_clients())
+    except Exception as e:
+        # Tasks create the clients lazily anyway, so a failed warm-up is not fatal
+        logger.warning(f"Could not pre-create AI clients: {e}")
+
+
+@worker_process_shutdown.connect
+def close_worker_loop(**kwargs):
+    """Close shared clients while their loop is still alive, then stop the loop"""
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    run_in_worker_loop(APIClient.aclose_shared())
+    run_in_worker_loop(AIFactory.aclose_clients())
+    close_mongo_clients()
+    _worker_loop.call_soon_threadsafe(_worker_loop.stop)
+    _worker_loop_thread.join()
+    _worker_loop.close()
+
+
 # Register task executors with the task registry
 def register_tasks():
     """Register task executors following the reference project pattern"""
@@ -84,83 +172,95 @@ def register_tasks():
 @celery_app.task(name="contract_analysis.parse_document", bind=True)
 def parse_contract_document(self, task_info_dict):
     """Shared task: Parse contract document"""
-    task_info = TaskInfo(**task_info_dict)
-    executor = task_registry.get_executor("contract_analysis.parse_document", task_info)
-
-    # Run the executor asynchronously
-    import asyncio
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(executor.run(task_info_dict))
-        return result
-    finally:
-        loop.close()
+    result = run_in_worker_loop(_execute("contract_analysis.parse_document", task_info_dict))
+    return result
 
 
 @celery_app.task(name="contract_analysis.analyze_clauses", bind=True)
 def analyze_contract_clauses(self, task_info_dict):
     """Shared task: Analyze contract clauses"""
-    task_info = TaskInfo(**task_info_dict)
-    executor = task_registry.get_executor("contract_analysis.analyze_clauses", task_info)
-
-    # Run the executor asynchronously
-    import asyncio
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(executor.run(task_info_dict))
-        return result.dict() if hasattr(result, 'dict') else result
-    finally:
-        loop.close()
+    result = run_in_worker_loop(_execute("contract_analysis.analyze_clauses", task_info_dict))
+    return result
 
 
 @celery_app.task(name="contract_analysis.evaluate_health", bind=True)
 def evaluate_contract_health(self, task_info_dict):
     """Shared task: Evaluate contract health"""
-    task_info = TaskInfo(**task_info_dict)
-    executor = task_registry.get_executor("contract_analysis.evaluate_health", task_info)
-
-    import asyncio
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(executor.run(task_info_dict))
-        return result.dict() if hasattr(result, 'dict') else result
-    finally:
-        loop.close()
+    result = run_in_worker_loop(_execute("contract_analysis.evaluate_health", task_info_dict))
+    return result
 
 
 @celery_app.task(name="contract_analysis.change_state", bind=True)
 def change_contract_state(self, state, task_info_dict):
     """Shared task: Change contract state"""
-    task_info = TaskInfo(**task_info_dict)
-    executor = task_registry.get_executor("contract_analysis.change_state", task_info)
-
-    import asyncio
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(executor.run(state, task_info_dict))
-        return result
-    finally:
-        loop.close()
+    result = run_in_worker_loop(_execute("contract_analysis.change_state", task_info_dict, state))
+    return result
 
 
 @celery_app.task(name="contract_analysis.report_failure", bind=True)
 def report_contract_failure(self, error_message, task_info_dict):
     """Shared task: Report contract failure"""
-    task_info = TaskInfo(**task_info_dict)
-    executor = task_registry.get_executor("contract_analysis.report_failure", task_info)
+    result = run_in_worker_loop(_execute("contract_analysis.report_failure", task_info_dict, error_message))
+    return result
+
 
-    import asyncio
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+async def _run_pipeline(task_info: TaskInfo, task_info_dict):
+    """Run the processing state change, parse, analyze and evaluate steps in order
+
+    Every executor reports its own failure to the API before re-raising, so a
+    failing step stops the pipeline the same way a failed chain link would.
+    """
+    state_executor = task_registry.get_executor("contract_analysis.change_state", task_info)
+    parse_executor = task_registry.get_executor("contract_analysis.parse_document", task_info)
+
+    # The contract read does not depend on the processing state write, so both
+    # requests go out together. A failed read is left for the parse step to
+    # retry, so that it is reported like any other parsing failure.
+    state_change, prefetch = await asyncio.gather(
+        state_executor.run(ContractState.processing.value, task_info_dict),
+        parse_executor.get_contract(),
+        return_exceptions=True
+    )
+    if isinstance(state_change, BaseException):
+        raise state_change
+    if isinstance(prefetch, Exception):
+        logger.warning(f"Contract prefetch failed, the parse step will retry it: {prefetch}")
+    elif isinstance(prefetch, BaseException):
+        raise prefetch
+
+    # Analysis works on the in-memory text, so the parsed-text write to
+    # storage overlaps with the analysis call instead of delaying it
+    await parse_executor.run(task_info_dict, wait_for_save=False)
+
+    # The analysis is saved together with the evaluation and final state
+    analyze_executor = task_registry.get_executor("contract_analysis.analyze_clauses", task_info)
     try:
-        result = loop.run_until_complete(executor.run(error_message, task_info_dict))
-        return result
-    finally:
-        loop.close()
+        analysis = await analyze_executor.run(
+            task_info_dict,
+            persist=False,
+            document_text=parse_executor.text
+        )
+    except BaseException:
+        # The analysis failure has been reported; stop the pending text write
+        # so it cannot replace that report or the raised error with its own
+        parse_executor.saving.cancel()
+        await asyncio.gather(parse_executor.saving, return_exceptions=True)
+        raise
+    await parse_executor.saving
+
+    # Evaluate the clauses analysis just produced instead of reading them back
+    evaluate_executor = task_registry.get_executor("contract_analysis.evaluate_health", task_info)
+    return await evaluate_executor.run(
+        task_info_dict,
+        clauses=analyze_executor.clauses,
+        analysis=analysis
+    )
+
+
+@celery_app.task(name="contract_analysis.run_pipeline", bind=True)
+def run_analysis_pipeline(self, task_info_dict):
+    """Shared task: Run the whole analysis pipeline as one broker message"""
+    return run_in_worker_loop(_run_pipeline(TaskInfo(**task_info_dict), task_info_dict))
 
 
 # Print settings
@@ -17,6 +17,8 @@ class TaskRegistry:
     def __init__(self):
         self._tasks: Dict[str, Type[TaskExecutor]] = {}
         self._logger_factory: Callable = setup_logger
+        # Built once at registration, so dispatching a task does not set up a logger
+        self._loggers: Dict[str, logging.Logger] = {}
 
     def register_task(
         self,
@@ -28,17 +30,20 @@ class TaskRegistry:
         self._tasks[task_name] = executor_class
         if logger_factory:
             self._logger_factory = logger_factory
+        self._loggers[task_name] = self._logger_factory()
 
         logger.info(f"Registered task: {task_name} -> {executor_class.__name__}")
 
     def get_executor(self, task_name: str, task_info: TaskInfo) -> TaskExecutor:
-        """Get an executor instance for a task"""
+        """Get an executor instance for a task
+
+        Executors keep per-run state, so a new one is built for every task;
+        only the logger is shared.
+        """
         if task_name not in self._tasks:
             raise ValueError(f"Task {task_name} not registered")
 
-        executor_class = self._tasks[task_name]
-        task_logger = self._logger_factory()
-        return executor_class(task_info, task_logger)
+        return self._tasks[task_name](task_info, self._loggers[task_name])
 
     def list_tasks(self) -> Dict[str, str]:
         """List all registered tasks"""
@@ -0,0 +1,159 @@
+"""Unit tests for the single-task analysis pipeline"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from analyze_contracts.main import _run_pipeline, task_registry
+
+TASK_INFO_DICT = {"run_id": "run_id", "contract_id": "contract_id"}
+
+
+class FakeExecutor:
+    """Executor stand-in that records its run() calls"""
+
+    def __init__(self, name, calls, result=None, error=None):
+        self.name = name
+        self.calls = calls
+        self.result = result
+        self.error = error
+
+    async def run(self, *args, **kwargs):
+        self.calls.append(self.name)
+        self.args = args
+        self.kwargs = kwargs
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class FakeParseExecutor(FakeExecutor):
+    """Parse stand-in that starts a parsed-text write like the real executor"""
+
+    def __init__(self, calls, error=None, save_error=None):
+        super().__init__("parse", calls, error=error)
+        self.get_contract = AsyncMock(return_value={"filename": "test.pdf"})
+        self.save_error = save_error
+        self.text = None
+        self.saving = None
+
+    async def _save(self):
+        await asyncio.sleep(0.01)
+        self.calls.append("save")
+        if self.save_error:
+            raise self.save_error
+
+    async def run(self, *args, **kwargs):
+        await super().run(*args, **kwargs)
+        self.text = "parsed text"
+        self.saving = asyncio.ensure_future(self._save())
+
+
+def make_executors(calls, **errors):
+    """Fake executors for every pipeline step; ``errors`` maps step names to raised errors"""
+    analyze = FakeExecutor("analyze", calls, result={"clauses": []}, error=errors.get("analyze"))
+    analyze.clauses = ["clause"]
+    return {
+        "contract_analysis.change_state": FakeExecutor("state", calls, error=errors.get("state")),
+        "contract_analysis.parse_document": FakeParseExecutor(
+            calls,
+            error=errors.get("parse"),
+            save_error=errors.get("save")
+        ),
+        "contract_analysis.analyze_clauses": analyze,
+        "contract_analysis.evaluate_health": FakeExecutor(
+            "evaluate",
+            calls,
+            result={"overall_score": 90},
+            error=errors.get("evaluate")
+        ),
+    }
+
+
+async def run_pipeline(executors):
+    with patch.object(task_registry, "get_executor", side_effect=lambda name, info: executors[name]):
+        return await _run_pipeline(None, TASK_INFO_DICT)
+
+
+class TestRunPipeline:
+    """Test step ordering and failure propagation of _run_pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_runs_steps_in_order(self):
+        """Test every step runs once, in order, and the evaluation is returned"""
+        calls = []
+        executors = make_executors(calls)
+
+        result = await run_pipeline(executors)
+
+        assert result == {"overall_score": 90}
+        assert calls == ["state", "parse", "analyze", "save", "evaluate"]
+        parse = executors["contract_analysis.parse_document"]
+        analyze = executors["contract_analysis.analyze_clauses"]
+        evaluate = executors["contract_analysis.evaluate_health"]
+        assert executors["contract_analysis.change_state"].args == ("processing", TASK_INFO_DICT)
+        assert parse.kwargs == {"wait_for_save": False}
+        assert analyze.kwargs == {"persist": False, "document_text": "parsed text"}
+        assert evaluate.kwargs == {"clauses": ["clause"], "analysis": {"clauses": []}}
+
+    @pytest.mark.asyncio
+    async def test_state_change_failure_stops_pipeline(self):
+        """Test a failed processing state change is raised before parsing"""
+        calls = []
+        error = RuntimeError("state change failed")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await run_pipeline(make_executors(calls, state=error))
+
+        assert exc_info.value is error
+        assert calls == ["state"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_failure_is_left_to_parse(self):
+        """Test a failed contract prefetch does not stop the pipeline"""
+        calls = []
+        executors = make_executors(calls)
+        parse = executors["contract_analysis.parse_document"]
+        parse.get_contract.side_effect = RuntimeError("contract read failed")
+
+        await run_pipeline(executors)
+
+        assert calls == ["state", "parse", "analyze", "save", "evaluate"]
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_stops_pipeline(self):
+        """Test a parse failure is raised and analysis never starts"""
+        calls = []
+        error = RuntimeError("parse failed")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await run_pipeline(make_executors(calls, parse=error))
+
+        assert exc_info.value is error
+        assert calls == ["state", "parse"]
+
+    @pytest.mark.asyncio
+    async def test_analysis_failure_is_not_masked_by_save(self):
+        """Test an analysis failure is raised as is and the pending text write is stopped"""
+        calls = []
+        error = RuntimeError("analysis failed")
+        executors = make_executors(calls, analyze=error, save=RuntimeError("save failed"))
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await run_pipeline(executors)
+
+        assert exc_info.value is error
+        assert calls == ["state", "parse", "analyze"]
+        assert executors["contract_analysis.parse_document"].saving.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_save_failure_stops_pipeline(self):
+        """Test a failed parsed-text write is raised before evaluation"""
+        calls = []
+        error = RuntimeError("save failed")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await run_pipeline(make_executors(calls, save=error))
+
+        assert exc_info.value is error
+        assert calls == ["state", "parse", "analyze", "save"]
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""Unit tests for the orjson Celery serializer"""
+
+import json
+
+from kombu.serialization import dumps, loads
+from pydantic import BaseModel
+
+from pwc.task_interface.serialization import (
+    ORJSON_CONTENT_TYPE,
+    ORJSON_SERIALIZER,
+    register_orjson_serializer,
+)
+
+register_orjson_serializer()
+
+
+class Result(BaseModel):
+    score: int
+    clauses: list
+
+
+class TestOrjsonSerializer:
+    """Test the orjson kombu serializer"""
+
+    def test_round_trips_task_payload(self):
+        """Test plain task arguments decode to the same values"""
+        payload = [[{"run_id": "run_id", "contract_id": "contract_id"}], {}, {}]
+
+        content_type, encoding, body = dumps(payload, serializer=ORJSON_SERIALIZER)
+
+        assert content_type == ORJSON_CONTENT_TYPE
+        assert loads(body, content_type, encoding) == payload
+
+    def test_encodes_pydantic_results_as_dicts(self):
+        """Test pydantic task results decode like their model_dump"""
+        result = Result(score=90, clauses=["clause"])
+
+        content_type, encoding, body = dumps({"result": result}, serializer=ORJSON_SERIALIZER)
+
+        assert loads(body, content_type, encoding) == {"result": result.model_dump()}
+
+    def test_stdlib_json_consumers_can_decode(self):
+        """Test messages decode with the stdlib json module, as in workers without the registration"""
+        payload = [[{"run_id": "run_id"}], {}, {}]
+
+        content_type, encoding, body = dumps(payload, serializer=ORJSON_SERIALIZER)
+
+        assert (content_type, encoding) == ("application/json", "utf-8")
+        assert json.loads(body.decode(encoding)) == payload
\ No newline at end of file
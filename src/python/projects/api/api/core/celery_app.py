@@ -1,27 +1,32 @@
 from celery import Celery
 from pwc.settings import settings
+from pwc.task_interface.serialization import ORJSON_SERIALIZER, register_orjson_serializer
+from pwc.task_interface.routing import TASK_ROUTES
+
+# Task bodies and results are encoded with orjson instead of the stdlib json module
+register_orjson_serializer()
 
 # Create Celery app
 celery_app = Celery(
     "pwc_contract_analysis",
     broker=settings.celery_broker_url,
-    backend=settings.celery_result_backend,
-    include=[
-        "analyze_contracts.tasks.analyze",
-        "analyze_contracts.tasks.evaluate"
-    ]
+    backend=settings.celery_result_backend
 )
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer=ORJSON_SERIALIZER,
+    accept_content=["json", ORJSON_SERIALIZER],
+    result_serializer=ORJSON_SERIALIZER,
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    task_routes=TASK_ROUTES,
+    # Ack after the task finishes so a crashed worker's task is redelivered
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
 )
\ No newline at end of file
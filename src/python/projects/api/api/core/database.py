@@ -6,13 +6,22 @@ from ..db.models import Contract, Client, User, LogEntry, MetricEntry, PromptTem
 
 logger = setup_logger(__name__)
 
+# One Motor client (and connection pool) per API process, created on startup
+_client = None
+
 
 async def init_database():
     """Initialize MongoDB connection and Beanie ODM"""
+    global _client
     try:
-        # Create Motor client
-        client = motor.motor_asyncio.AsyncIOMotorClient(settings.mongodb_url)
-        database = client[settings.mongodb_database]
+        # Create Motor client once; warm connections avoid a handshake on the first requests
+        if _client is None:
+            _client = motor.motor_asyncio.AsyncIOMotorClient(
+                settings.mongodb_url,
+                maxPoolSize=settings.mongodb_max_pool_size,
+                minPoolSize=settings.mongodb_min_pool_size
+            )
+        database = _client[settings.mongodb_database]
 
         # Initialize Beanie with document models
         await init_beanie(
@@ -35,4 +44,8 @@ async def init_database():
 
 async def close_database():
     """Close database connections"""
-    logger.info("Closing database connections")
\ No newline at end of file
+    global _client
+    logger.info("Closing database connections")
+    if _client is not None:
+        _client.close()
+        _client = None
\ No newline at end of file
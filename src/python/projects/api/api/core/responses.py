@@ -0,0 +1,16 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson
+
+    FastAPI's own ORJSONResponse is deprecated in favour of response models,
+    but most handlers here return plain dicts or documents, which still go
+    through the response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
\ No newline at end of file
@@ -1,47 +1,150 @@
+import asyncio
+import hashlib
+import hmac
+import time
+import bcrypt
 from datetime import datetime, timedelta
-from typing import Optional, Union, Dict, Any
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Union, Dict, Any, Tuple
+import jwt
+from jwt import InvalidTokenError as JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from pwc.settings import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-# JWT settings
+# JWT settings; settings are frozen, so the signing key is encoded once here
 security = HTTPBearer()
+JWT_ALGORITHM = "HS256"
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+JWT_SECRET_KEY = settings.secret_key.encode("utf-8")
+
+# Verified tokens, keyed by the SHA-256 digest of the token, so repeat requests
+# skip the HMAC check and JSON parse without the cache holding bearer tokens.
+# Entries live for TOKEN_CACHE_TTL seconds at most and never past the token's
+# own exp claim.
+TOKEN_CACHE_TTL = 60.0
+TOKEN_CACHE_MAX_SIZE = 8192
+_token_cache: Dict[bytes, Tuple[float, "TokenUser"]] = {}
+_internal_token_cache: Dict[bytes, Tuple[float, str]] = {}
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _cache_get(cache: Dict[Any, Tuple[float, Any]], token: Any) -> Optional[Any]:
+    entry = cache.get(token)
+    if entry is None:
+        return None
+    if entry[0] <= time.time():
+        cache.pop(token, None)
+        return None
+    return entry[1]
+
+
+def _cache_put(
+    cache: Dict[Any, Tuple[float, Any]],
+    token: Any,
+    payload: Dict[str, Any],
+    value: Any,
+    ttl: float = TOKEN_CACHE_TTL
+):
+    expires_at = time.time() + ttl
+    exp = payload.get("exp")
+    if exp is not None:
+        expires_at = min(expires_at, float(exp))
+    if len(cache) >= TOKEN_CACHE_MAX_SIZE:
+        cache.pop(next(iter(cache)))  # drop the oldest entry
+    cache[token] = (expires_at, value)
 
 
 class TokenUser(BaseModel):
     """User information extracted from JWT token"""
+    # Instances are cached and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     username: str
     user_id: str
     email: str
     is_active: bool
 
 
+# bcrypt only considers the first 72 bytes of a password
+BCRYPT_MAX_BYTES = 72
+# Same work factor passlib used for the existing hashes
+BCRYPT_ROUNDS = 12
+
+
+def _bcrypt_secret(password: str) -> bytes:
+    """Encode a password once and truncate it to bcrypt's 72-byte limit
+
+    A multibyte character split by the cut is dropped whole, which matches
+    the hashes made by the earlier encode/slice/decode(errors="ignore") code.
+    """
+    secret = password.encode("utf-8")
+    if len(secret) <= BCRYPT_MAX_BYTES:
+        return secret
+
+    cut = BCRYPT_MAX_BYTES
+    while secret[cut] & 0xC0 == 0x80:  # continuation byte: back up to the character start
+        cut -= 1
+    return secret[:cut]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    # Truncate password to 72 bytes for bcrypt compatibility
-    if len(plain_password.encode('utf-8')) > 72:
-        plain_password = plain_password.encode('utf-8')[:72].decode('utf-8', errors='ignore')
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_bcrypt_secret(plain_password), hashed_password.encode("ascii"))
+
+
+# Successful password checks, keyed by an HMAC of username, stored hash and
+# password, so repeat logins within PASSWORD_CACHE_TTL seconds skip bcrypt.
+# The stored hash is part of the key, so a password change invalidates it.
+PASSWORD_CACHE_TTL = 30.0
+_password_cache: Dict[bytes, Tuple[float, bool]] = {}
+# Checks still running, so concurrent identical attempts share one bcrypt call
+_password_checks: Dict[bytes, asyncio.Future] = {}
+
+
+async def verify_password_cached(username: str, plain_password: str, hashed_password: str) -> bool:
+    """Verify a password off the event loop, reusing recent successful checks"""
+    key = hmac.new(
+        JWT_SECRET_KEY,
+        "\0".join((username, hashed_password, plain_password)).encode("utf-8"),
+        hashlib.sha256
+    ).digest()
+    if _cache_get(_password_cache, key):
+        return True
+
+    check = _password_checks.get(key)
+    if check is None:
+        # bcrypt releases the GIL, so the check runs in parallel with other requests
+        check = _password_checks[key] = asyncio.ensure_future(
+            asyncio.to_thread(verify_password, plain_password, hashed_password)
+        )
+        check.add_done_callback(lambda _: _password_checks.pop(key, None))
+
+    # Shielded so one cancelled waiter does not cancel the check for the others
+    verified = await asyncio.shield(check)
+    if verified:
+        _cache_put(_password_cache, key, {}, True, ttl=PASSWORD_CACHE_TTL)
+    return verified
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    # Truncate password to 72 bytes for bcrypt compatibility
-    # bcrypt only considers the first 72 bytes anyway
-    if len(password.encode('utf-8')) > 72:
-        password = password.encode('utf-8')[:72].decode('utf-8', errors='ignore')
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_bcrypt_secret(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
+
+
+# Tokens signed for users, handed out again to logins with the same claims
+# and lifetime within one ACCESS_TOKEN_REUSE_WINDOW-second window
+ACCESS_TOKEN_REUSE_WINDOW = 15
+_access_token_cache: Dict[tuple, Tuple[float, str]] = {}
 
 
 def create_access_token(user_data: Union[dict, Any], expires_delta: Optional[timedelta] = None):
     """Create JWT access token with enhanced user information"""
+    cache_key = None
     # Handle both dict data and User objects
     if hasattr(user_data, 'username'):  # User object
         to_encode = {
@@ -50,6 +153,10 @@ def create_access_token(user_data: Union[dict, Any], expires_delta: Optional[tim
             "email": user_data.email,
             "is_active": user_data.is_active,
         }
+        cache_key = (*to_encode.values(), expires_delta, int(time.time() // ACCESS_TOKEN_REUSE_WINDOW))
+        cached = _cache_get(_access_token_cache, cache_key)
+        if cached is not None:
+            return cached
     else:  # Legacy dict data
         to_encode = user_data.copy()
 
@@ -59,48 +166,64 @@ def create_access_token(user_data: Union[dict, Any], expires_delta: Optional[tim
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm="HS256")
+    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    if cache_key is not None:
+        _cache_put(_access_token_cache, cache_key, {}, encoded_jwt, ttl=ACCESS_TOKEN_REUSE_WINDOW)
     return encoded_jwt
 
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenUser:
-    """Verify JWT token and return user information"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+def decode_user_token(token: str) -> Optional[TokenUser]:
+    """Return the user of a valid JWT token, or None, caching verified tokens"""
+    key = _token_key(token)
+    cached = _cache_get(_token_cache, key)
+    if cached is not None:
+        return cached
 
     try:
-        payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=["HS256"])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-
-        # Extract enhanced user information from token
-        user_id = payload.get("user_id")
-        email = payload.get("email")
-        is_active = payload.get("is_active", True)
-
-        # Handle legacy tokens that only have username
-        if user_id is None:
-            # For legacy tokens, we'll need to maintain backwards compatibility
-            # but log a warning that enhanced tokens should be used
-            return TokenUser(
-                username=username,
-                user_id="",  # Empty for legacy tokens
-                email="",    # Empty for legacy tokens
-                is_active=True  # Default for legacy tokens
-            )
-
-        return TokenUser(
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=JWT_ALGORITHMS)
+    except JWTError:
+        return None
+    username: str = payload.get("sub")
+    if username is None:
+        return None
+
+    # Extract enhanced user information from token
+    user_id = payload.get("user_id")
+    email = payload.get("email")
+    is_active = payload.get("is_active", True)
+
+    # Handle legacy tokens that only have username
+    if user_id is None:
+        # For legacy tokens, we'll need to maintain backwards compatibility
+        # but log a warning that enhanced tokens should be used
+        token_user = TokenUser(
+            username=username,
+            user_id="",  # Empty for legacy tokens
+            email="",    # Empty for legacy tokens
+            is_active=True  # Default for legacy tokens
+        )
+    else:
+        token_user = TokenUser(
             username=username,
             user_id=user_id,
             email=email,
             is_active=is_active
         )
-    except JWTError:
-        raise credentials_exception
+
+    _cache_put(_token_cache, key, payload, token_user)
+    return token_user
+
+
+def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenUser:
+    """Verify JWT token and return user information"""
+    token_user = decode_user_token(credentials.credentials)
+    if token_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token_user
 
 
 # Dependency to get current user from token
@@ -132,14 +255,20 @@ def verify_internal_token(credentials: HTTPAuthorizationCredentials = Depends(se
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    token = credentials.credentials
+    key = _token_key(token)
+    cached = _cache_get(_internal_token_cache, key)
+    if cached is not None:
+        return cached
+
     try:
-        payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=["HS256"])
-        token_type = payload.get("type")
-        issuer = payload.get("iss")
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=JWT_ALGORITHMS)
+    except JWTError:
+        raise credentials_exception
 
-        if token_type != "internal" or issuer != "pwc_api":
-            raise credentials_exception
+    if payload.get("type") != "internal" or payload.get("iss") != "pwc_api":
+        raise credentials_exception
 
-        return payload.get("sub", "internal_worker")
-    except JWTError:
-        raise credentials_exception
\ No newline at end of file
+    subject = payload.get("sub", "internal_worker")
+    _cache_put(_internal_token_cache, key, payload, subject)
+    return subject
\ No newline at end of file
@@ -2,9 +2,17 @@ from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from beanie import Document, PydanticObjectId
 from pydantic import Field, BaseModel
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from pwc.task_interface.schema import ContractState
 
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Timestamp default for created_at/updated_at/timestamp fields"""
+    return datetime.now(_UTC)
+
 
 class User(Document):
     """User model for authentication"""
@@ -12,10 +20,15 @@ class User(Document):
     email: str = Field(..., unique=True)
     hashed_password: str
     is_active: bool = True
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
 
     class Settings:
         name = "users"
+        # Field(unique=True) is not enforced by Beanie, so the indexes carry it
+        indexes = [
+            IndexModel("username", unique=True),
+            IndexModel("email", unique=True)
+        ]
 
 
 class Client(Document):
@@ -24,11 +37,14 @@ class Client(Document):
     email: Optional[str] = None
     company: Optional[str] = None
     created_by: str  # username
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     class Settings:
         name = "clients"
+        indexes = [
+            "created_by"
+        ]
 
 
 class Contract(Document):
@@ -54,17 +70,58 @@ class Contract(Document):
     pipeline_runs: List[Dict[str, Any]] = Field(default_factory=list)
 
     # Metadata
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     error_message: Optional[str] = None
 
     class Settings:
         name = "contracts"
+        # Contracts are listed and counted per uploader, optionally by status
+        indexes = [
+            [("uploaded_by", ASCENDING), ("status", ASCENDING)],
+            "status",
+            "client_id"
+        ]
+
+
+class ContractFileProjection(BaseModel):
+    """Contract fields needed to load and parse the uploaded file"""
+    filename: str
+    file_path: str
+
+
+class ContractAnalysisProjection(BaseModel):
+    """Contract fields needed to evaluate a stored analysis"""
+    analysis_result: Optional[Dict[str, Any]] = None
+
+
+class ContractListView(BaseModel):
+    """Contract fields shown in contract listings"""
+    id: PydanticObjectId = Field(alias="_id")
+    filename: str
+    title: Optional[str] = None
+    status: str
+    client_id: Optional[PydanticObjectId] = None
+    uploaded_by: str
+    created_at: datetime
+
+
+class ContractListViewWithResults(ContractListView):
+    """Contract listing fields plus the analysis and evaluation results"""
+    analysis_result: Optional[Dict[str, Any]] = None
+    evaluation_result: Optional[Dict[str, Any]] = None
+
+
+# Projections the internal contract endpoint serves by name
+CONTRACT_PROJECTIONS = {
+    "file": ContractFileProjection,
+    "analysis": ContractAnalysisProjection
+}
 
 
 class LogEntry(Document):
     """Log entry for API request tracking"""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
     user: Optional[str] = None
     endpoint: str
     method: str
@@ -76,17 +133,24 @@ class LogEntry(Document):
 
     class Settings:
         name = "logs"
+        indexes = [
+            [("timestamp", DESCENDING)],
+            [("user", ASCENDING), ("timestamp", DESCENDING)]
+        ]
 
 
 class MetricEntry(Document):
     """Metrics for system monitoring"""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
     metric_name: str
     metric_value: float
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
     class Settings:
         name = "metrics"
+        indexes = [
+            [("metric_name", ASCENDING), ("timestamp", DESCENDING)]
+        ]
 
 
 class PromptTemplate(Document):
@@ -100,8 +164,8 @@ class PromptTemplate(Document):
     tags: List[str] = Field(default_factory=list, description="Tags for categorization")
     variables: List[str] = Field(default_factory=list, description="Template variable placeholders")
     active: bool = Field(default=True, description="Whether template is active")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     class Settings:
         name = "prompt_templates"
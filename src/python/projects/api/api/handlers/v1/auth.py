@@ -2,8 +2,9 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
+from pymongo.errors import DuplicateKeyError
 
-from ...core.security import verify_password, create_access_token, get_password_hash
+from ...core.security import verify_password_cached, create_access_token, get_password_hash
 from ...db.models import User
 from pwc.settings import settings
 
@@ -30,29 +31,24 @@ class Token(BaseModel):
 @router.post("/register", response_model=UserResponse)
 async def register_user(user_data: UserCreate):
     """Register a new user"""
-    # Check if user already exists
-    existing_user = await User.find_one(User.username == user_data.username)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
-
-    existing_email = await User.find_one(User.email == user_data.email)
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-
-    # Create new user
     hashed_password = get_password_hash(user_data.password)
     user = User(
         username=user_data.username,
         email=user_data.email,
         hashed_password=hashed_password
     )
-    await user.insert()
+
+    # The unique indexes on username and email reject duplicates, so a single
+    # insert replaces the existence checks and cannot race another registration
+    try:
+        await user.insert()
+    except DuplicateKeyError as e:
+        key_pattern = (e.details or {}).get("keyPattern", {})
+        detail = "Username already registered" if "username" in key_pattern else "Email already registered"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
 
     return UserResponse(
         username=user.username,
@@ -66,7 +62,7 @@ async def login_user(form_data: OAuth2PasswordRequestForm = Depends()):
     """Login user and return JWT token"""
     # Find user
     user = await User.find_one(User.username == form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_cached(user.username, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from beanie import PydanticObjectId
 from pydantic import BaseModel
@@ -23,6 +23,7 @@ class ClientResponse(BaseModel):
     company: Optional[str] = None
     created_by: str
     created_at: datetime
+    contract_count: int = 0
 
 
 class ContractSummary(BaseModel):
@@ -32,6 +33,17 @@ class ContractSummary(BaseModel):
     created_at: datetime
 
 
+async def _count_contracts_by_client(client_ids: List[PydanticObjectId]) -> Dict[PydanticObjectId, int]:
+    """Count the contracts of many clients with a single grouped query"""
+    if not client_ids:
+        return {}
+    counts = await Contract.aggregate([
+        {"$match": {"client_id": {"$in": client_ids}}},
+        {"$group": {"_id": "$client_id", "count": {"$sum": 1}}}
+    ]).to_list()
+    return {row["_id"]: row["count"] for row in counts}
+
+
 @router.post("/", response_model=ClientResponse)
 async def create_client(
     client_data: ClientCreate,
@@ -60,8 +72,9 @@ async def create_client(
 async def list_clients(
     current_user: TokenUser = Depends(get_current_user)
 ):
-    """Get all clients for the current user"""
+    """Get all clients for the current user, with their contract counts"""
     clients = await Client.find(Client.created_by == current_user.username).to_list()
+    contract_counts = await _count_contracts_by_client([client.id for client in clients])
 
     return [
         ClientResponse(
@@ -70,7 +83,8 @@ async def list_clients(
             email=client.email,
             company=client.company,
             created_by=client.created_by,
-            created_at=client.created_at
+            created_at=client.created_at,
+            contract_count=contract_counts.get(client.id, 0)
         )
         for client in clients
     ]
@@ -82,28 +96,51 @@ async def get_client_contracts(
     current_user: TokenUser = Depends(get_current_user)
 ):
     """Get all contracts for a specific client"""
-    client = await Client.get(client_id)
-    if not client:
+    try:
+        client_obj_id = PydanticObjectId(client_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+
+    # Client and its contract summaries in one round trip
+    results = await Client.aggregate([
+        {"$match": {"_id": client_obj_id}},
+        {"$lookup": {
+            "from": Contract.Settings.name,
+            "localField": "_id",
+            "foreignField": "client_id",
+            "as": "contracts"
+        }},
+        {"$project": {
+            "created_by": 1,
+            "contracts._id": 1,
+            "contracts.filename": 1,
+            "contracts.status": 1,
+            "contracts.created_at": 1
+        }}
+    ]).to_list()
+    if not results:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Client not found"
         )
+    client = results[0]
 
     # Ensure user can only access their own clients
-    if client.created_by != current_user.username:
+    if client["created_by"] != current_user.username:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied to this client"
         )
 
-    contracts = await Contract.find(Contract.client_id == PydanticObjectId(client_id)).to_list()
-
     return [
         ContractSummary(
-            id=str(contract.id),
-            filename=contract.filename,
-            status=contract.status,
-            created_at=contract.created_at
+            id=str(contract["_id"]),
+            filename=contract["filename"],
+            status=contract["status"],
+            created_at=contract["created_at"]
         )
-        for contract in contracts
+        for contract in client["contracts"]
     ]
\ No newline at end of file
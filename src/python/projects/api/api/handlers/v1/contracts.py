@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
@@ -5,7 +6,7 @@ from beanie import PydanticObjectId
 from pydantic import BaseModel
 
 from ...core.security import get_current_user, TokenUser
-from ...db.models import Contract, Client
+from ...db.models import Contract, Client, ContractListView, ContractListViewWithResults
 from pwc.task_interface.schema import ContractState
 from pwc.storage import StorageFactory
 from pwc.settings import settings
@@ -14,11 +15,11 @@ from ...core.security import generate_internal_token
 
 router = APIRouter()
 
-# Initialize storage
-storage = StorageFactory.create_storage(
-    settings.storage_type,
-    base_path=settings.local_storage_path
-)
+# Shared storage configured in settings
+storage = StorageFactory.get_storage()
+
+# Prefix of the per-run storage roots handed to the worker
+_CONTRACTS_ROOT = f"{settings.local_storage_path}/contracts/"
 
 
 class ContractCreate(BaseModel):
@@ -63,34 +64,52 @@ async def create_contract(
             detail="Only PDF files are supported"
         )
 
-    # Validate client exists if provided
+    # Check the client before anything is written
+    client_obj_id = None
     if client_id:
-        client = await Client.get(client_id)
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Client not found"
-            )
-
-    # Read file content
-    content = await file.read()
-
-    # Store file
-    file_path = f"contracts/{datetime.now(timezone.utc).strftime('%Y/%m/%d')}/{file.filename}"
-    stored_path = await storage.save(content, file_path)
-
-    # Create contract record
+        client_not_found = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+        try:
+            client_obj_id = PydanticObjectId(client_id)
+        except Exception:
+            raise client_not_found
+        if not await Client.get(client_obj_id):
+            raise client_not_found
+
+    # The contract ID is generated up front, so the upload can be streamed to
+    # storage while the document is inserted. Whichever write succeeded is
+    # undone if the other fails.
+    contract_id = PydanticObjectId()
+    file_path = f"contracts/{datetime.now(timezone.utc).strftime('%Y/%m/%d')}/{contract_id}/{file.filename}"
     contract = Contract(
+        id=contract_id,
         filename=file.filename,
         title=file.filename,  # Use filename as title initially
-        file_path=stored_path,
-        file_size=len(content),
+        file_path=file_path,
+        file_size=file.size,
         content_type=file.content_type,
-        client_id=PydanticObjectId(client_id) if client_id else None,
+        client_id=client_obj_id,
         uploaded_by=current_user.username
     )
 
-    await contract.insert()
+    saved, inserted = await asyncio.gather(
+        storage.save_file(file.file, file_path),
+        contract.insert(),
+        return_exceptions=True
+    )
+    if isinstance(saved, BaseException) or isinstance(inserted, BaseException):
+        if not isinstance(saved, BaseException):
+            await storage.delete(saved[0])
+        if not isinstance(inserted, BaseException):
+            await contract.delete()
+        raise saved if isinstance(saved, BaseException) else inserted
+
+    # Record where the file actually landed and how much was written
+    stored_path, file_size = saved
+    if (stored_path, file_size) != (contract.file_path, contract.file_size):
+        await contract.set({Contract.file_path: stored_path, Contract.file_size: file_size})
 
     return ContractResponse(
         id=str(contract.id),
@@ -110,14 +129,20 @@ async def list_contracts(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
+    include_results: bool = True,
     current_user: TokenUser = Depends(get_current_user)
 ):
-    """List contracts with optional filtering"""
+    """List contracts with optional filtering
+
+    Only the listed fields are read from MongoDB; ``include_results=false``
+    also leaves out the analysis and evaluation results.
+    """
     query = {"uploaded_by": current_user.username}  # Only show user's own contracts
     if status:
         query["status"] = status
 
-    contracts = await Contract.find(query).skip(skip).limit(limit).to_list()
+    view = ContractListViewWithResults if include_results else ContractListView
+    contracts = await Contract.find(query).skip(skip).limit(limit).project(view).to_list()
 
     return [
         ContractResponse(
@@ -128,8 +153,8 @@ async def list_contracts(
             client_id=str(contract.client_id) if contract.client_id else None,
             uploaded_by=contract.uploaded_by,
             created_at=contract.created_at,
-            analysis_result=contract.analysis_result,
-            evaluation_result=contract.evaluation_result
+            analysis_result=getattr(contract, "analysis_result", None),
+            evaluation_result=getattr(contract, "evaluation_result", None)
         )
         for contract in contracts
     ]
@@ -264,9 +289,8 @@ async def trigger_genai_analysis(
     # Generate internal token for worker communication
     internal_token = generate_internal_token()
 
-    # Create analysis workflow chain
+    # Create analysis workflow
     from uuid import uuid4
-    from celery import chain
 
     # Generate run ID
     run_id = str(uuid4())
@@ -275,7 +299,7 @@ async def trigger_genai_analysis(
     task_info_dict = {
         "run_id": run_id,
         "contract_id": str(contract.id),
-        "storage_root_path": str(settings.local_storage_path + "/contracts/" + str(contract.id) + "/" + run_id),
+        "storage_root_path": f"{_CONTRACTS_ROOT}{contract.id}/{run_id}",
         "api_auth_token": internal_token,
         "api_base_url": settings.api_base_url
     }
@@ -291,20 +315,13 @@ async def trigger_genai_analysis(
     contract.updated_at = datetime.now(timezone.utc)
     await contract.save()
 
-    # Create and execute the analysis pipeline using immutable signatures
-    # This prevents tasks from receiving previous task results as arguments
-    # NEW: Added separate parse step for strategy pattern
-    pipeline = chain(
-        celery_app.signature("contract_analysis.change_state", args=[ContractState.processing.value, task_info_dict], immutable=True),
-        celery_app.signature("contract_analysis.parse_document", args=[task_info_dict], immutable=True),
-        celery_app.signature("contract_analysis.analyze_clauses", args=[task_info_dict], immutable=True),
-        celery_app.signature("contract_analysis.evaluate_health", args=[task_info_dict], immutable=True),
-        celery_app.signature("contract_analysis.change_state", args=[ContractState.completed.value, task_info_dict], immutable=True)
+    # The worker runs state change, parse, analyze and evaluate in one task,
+    # so the pipeline costs a single broker round trip instead of one per step.
+    # Publishing is blocking I/O, so it runs off the event loop.
+    async_result = await asyncio.to_thread(
+        celery_app.send_task, "contract_analysis.run_pipeline", args=[task_info_dict]
     )
 
-    # Execute the pipeline asynchronously
-    async_result = pipeline.apply_async()
-
     return {
         "message": "Analysis pipeline triggered",
         "task_id": async_result.id if hasattr(async_result, 'id') else str(async_result),
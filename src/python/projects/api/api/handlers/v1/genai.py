@@ -17,18 +17,22 @@ router = APIRouter()
 # Setup logger
 logger = setup_logger(__name__)
 
-# Initialize AI client
-ai_client = AIFactory.create_client(
-    settings.ai_provider,
-    api_key=settings.openai_api_key,
-    model=settings.openai_model
-)
 
-# Initialize storage
-storage = StorageFactory.create_storage(
-    settings.storage_type,
-    base_path=settings.local_storage_path
-)
+def get_ai_client():
+    """Return the AI client for the serving event loop
+
+    AIFactory memoizes clients per event loop, so requests share one
+    connection pool bound to the loop that serves them.
+    """
+    return AIFactory.create_client(
+        settings.ai_provider,
+        api_key=settings.openai_api_key,
+        model=settings.openai_model
+    )
+
+
+# Shared storage configured in settings
+storage = StorageFactory.get_storage()
 
 
 class AnalysisResponse(BaseModel):
@@ -79,7 +83,7 @@ async def analyze_contract(
         )
 
     # Now pass the extracted text to AI client
-    result = await ai_client.analyze_contract(contract_text)
+    result = await get_ai_client().analyze_contract(contract_text)
 
     return AnalysisResponse(
         clauses=[clause.model_dump() for clause in result.clauses],
@@ -123,7 +127,7 @@ async def evaluate_contract(
     clause_objects = [ContractClause(**clause) for clause in analysis_clauses]
 
     # Evaluate contract
-    result = await ai_client.evaluate_contract(clause_objects)
+    result = await get_ai_client().evaluate_contract(clause_objects)
 
     # Store evaluation result in the contract
     contract.evaluation_result = {
@@ -203,7 +207,7 @@ async def analyze_document(
         # Analyze with AI
         try:
             logger.info("Starting AI analysis")
-            result = await ai_client.analyze_contract(contract_text)
+            result = await get_ai_client().analyze_contract(contract_text)
             logger.info(f"AI analysis completed with {len(result.clauses)} clauses")
         except Exception as e:
             logger.error(f"Error in AI analysis: {str(e)}")
@@ -283,7 +287,7 @@ async def evaluate_document(
     clause_objects = [ContractClause(**clause) for clause in analysis_clauses]
 
     # Evaluate contract
-    result = await ai_client.evaluate_contract(clause_objects)
+    result = await get_ai_client().evaluate_contract(clause_objects)
 
     # Store evaluation result in the contract
     contract.evaluation_result = {
@@ -323,7 +327,7 @@ async def evaluate_clauses(
         )
 
     # Evaluate clauses
-    result = await ai_client.evaluate_contract(clause_objects)
+    result = await get_ai_client().evaluate_contract(clause_objects)
 
     return EvaluationResponse(
         approved=result.approved,
@@ -1,11 +1,11 @@
 from datetime import datetime, timezone
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Path, status, BackgroundTasks, Depends
+from fastapi import APIRouter, HTTPException, Path, Query, status, BackgroundTasks, Depends
 from beanie import PydanticObjectId
 from pydantic import BaseModel
 
 from api.core.security import verify_internal_token
-from api.db.models import Contract, User
+from api.db.models import Contract, User, CONTRACT_PROJECTIONS
 from pwc.task_interface.schema import (
     ContractState,
     ContractAnalysisResult,
@@ -20,14 +20,50 @@ class FailureRequest(BaseModel):
     error_type: str = "processing_error"
 
 
-async def _get_contract(contract_id: str) -> Contract:
-    """Get contract by ID with error handling"""
+class EvaluationResultWithState(BaseModel):
+    result: ContractEvaluationResult
+    state: str
+    run_id: Optional[str] = None
+    # Sent by pipelines that defer saving the analysis to this final write
+    analysis_result: Optional[ContractAnalysisResult] = None
+
+
+def _parse_state(state: str) -> ContractState:
+    """Validate a state name from the request"""
+    try:
+        return ContractState(state)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid state: {state}")
+
+
+def _apply_state(contract: Contract, new_state: ContractState, run_id: Optional[str]):
+    """Set the contract state and record the pipeline run, without saving"""
+    contract.status = new_state.value
+    contract.updated_at = datetime.now(timezone.utc)
+
+    # Add pipeline run if provided
+    if run_id:
+        pipeline_run = {
+            "run_id": run_id,
+            "state": new_state.value,
+            "timestamp": datetime.now(timezone.utc)
+        }
+        if not contract.pipeline_runs:
+            contract.pipeline_runs = []
+        contract.pipeline_runs.append(pipeline_run)
+
+
+def _parse_contract_id(contract_id: str) -> PydanticObjectId:
+    """Validate a contract ID from the request"""
     try:
-        contract_obj_id = PydanticObjectId(contract_id)
+        return PydanticObjectId(contract_id)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid contract ID format")
 
-    contract = await Contract.get(contract_obj_id)
+
+async def _get_contract(contract_id: str) -> Contract:
+    """Get contract by ID with error handling"""
+    contract = await Contract.get(_parse_contract_id(contract_id))
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
     return contract
@@ -36,10 +72,27 @@ async def _get_contract(contract_id: str) -> Contract:
 @router.get("/{contract_id}/internal")
 async def get_contract_internal(
     contract_id: str = Path(..., description="Contract ID"),
+    projection: Optional[str] = Query(None, description="Named field subset to return"),
     _: str = Depends(verify_internal_token)
 ):
-    """Get contract details for internal worker access"""
-    contract = await _get_contract(contract_id)
+    """Get contract details for internal worker access
+
+    With ``projection`` only that subset of fields is read from MongoDB,
+    leaving out large results and pipeline history the caller does not need.
+    """
+    if projection is None:
+        return await _get_contract(contract_id)
+
+    projection_model = CONTRACT_PROJECTIONS.get(projection)
+    if projection_model is None:
+        raise HTTPException(status_code=400, detail=f"Invalid projection: {projection}")
+
+    contract = await Contract.find_one(
+        Contract.id == _parse_contract_id(contract_id),
+        projection_model=projection_model
+    )
+    if not contract:
+        raise HTTPException(status_code=404, detail="Contract not found")
     return contract
 
 
@@ -70,27 +123,9 @@ async def change_contract_state(
 ):
     """Update contract processing state"""
     contract = await _get_contract(contract_id)
+    new_state = _parse_state(state)
 
-    # Validate state
-    try:
-        new_state = ContractState(state)
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid state: {state}")
-
-    # Update state and timestamp
-    contract.status = new_state.value
-    contract.updated_at = datetime.now(timezone.utc)
-
-    # Add pipeline run if provided
-    if run_id:
-        pipeline_run = {
-            "run_id": run_id,
-            "state": new_state.value,
-            "timestamp": datetime.now(timezone.utc)
-        }
-        if not contract.pipeline_runs:
-            contract.pipeline_runs = []
-        contract.pipeline_runs.append(pipeline_run)
+    _apply_state(contract, new_state, run_id)
 
     await contract.save()
     return {"message": f"Contract state updated to {new_state.value}"}
@@ -106,7 +141,7 @@ async def set_analysis_result(
     contract = await _get_contract(contract_id)
 
     # Update contract with analysis results
-    contract.analysis_result = analysis_result.dict()
+    contract.analysis_result = analysis_result.model_dump()
     contract.updated_at = datetime.now(timezone.utc)
 
     await contract.save()
@@ -123,13 +158,32 @@ async def set_evaluation_result(
     contract = await _get_contract(contract_id)
 
     # Update contract with evaluation results
-    contract.evaluation_result = evaluation_result.dict()
+    contract.evaluation_result = evaluation_result.model_dump()
     contract.updated_at = datetime.now(timezone.utc)
 
     await contract.save()
     return {"message": "Evaluation result saved successfully"}
 
 
+@router.post("/{contract_id}/internal/set-evaluation-result-and-state")
+async def set_evaluation_result_and_state(
+    payload: EvaluationResultWithState,
+    contract_id: str = Path(..., description="Contract ID"),
+    _: str = Depends(verify_internal_token)
+):
+    """Save the evaluation (and optionally analysis) result and change state in a single write"""
+    contract = await _get_contract(contract_id)
+    new_state = _parse_state(payload.state)
+
+    if payload.analysis_result is not None:
+        contract.analysis_result = payload.analysis_result.model_dump()
+    contract.evaluation_result = payload.result.model_dump()
+    _apply_state(contract, new_state, payload.run_id)
+
+    await contract.save()
+    return {"message": f"Evaluation result saved and state updated to {new_state.value}"}
+
+
 @router.put("/{contract_id}/internal/failed")
 async def report_contract_failure(
     failure_data: FailureRequest,
@@ -1,12 +1,3 @@
-import sys
-import os
-from pathlib import Path
-
-# Add the shared library to the Python path
-current_dir = Path(__file__).parent
-libs_path = current_dir.parent.parent.parent / "libs"
-sys.path.insert(0, str(libs_path))
-
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
@@ -16,8 +7,9 @@ from pwc.settings import settings
 from pwc.logger import setup_logger
 from .core.database import init_database, close_database
 from .core.celery_app import celery_app
+from .core.responses import ORJSONResponse
 from .handlers.v1 import auth, contracts, clients, genai, logs, metrics, health, internal_contracts
-from .middleware import LoggingMiddleware
+from .middleware import LoggingMiddleware, GZipRequestMiddleware, log_buffer
 
 logger = setup_logger(__name__)
 
@@ -37,6 +29,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down PWC Contract Analysis API")
+    await log_buffer.close()
     await close_database()
 
 
@@ -44,12 +37,16 @@ app = FastAPI(
     title="PWC Contract Analysis API",
     description="API for analyzing contracts using GenAI",
     version=settings.app_version,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add logging middleware
 app.add_middleware(LoggingMiddleware)
 
+# Inflate gzip-encoded request bodies (large worker result payloads)
+app.add_middleware(GZipRequestMiddleware)
+
 # CORS
 if settings.backend_cors_origins:
     app.add_middleware(
@@ -1,3 +1,4 @@
-from .logging import LoggingMiddleware
+from .logging import LoggingMiddleware, log_buffer
+from .gzip_request import GZipRequestMiddleware
 
-__all__ = ["LoggingMiddleware"]
\ No newline at end of file
+__all__ = ["LoggingMiddleware", "GZipRequestMiddleware", "log_buffer"]
\ No newline at end of file
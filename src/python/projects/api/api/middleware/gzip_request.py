@@ -0,0 +1,56 @@
+import zlib
+
+from starlette.responses import PlainTextResponse
+
+# Upper bound for a decompressed body, guards against gzip bombs
+MAX_DECOMPRESSED_SIZE = 50 * 1024 * 1024
+
+
+class GZipRequestMiddleware:
+    """ASGI middleware that inflates request bodies sent with ``Content-Encoding: gzip``
+
+    Workers gzip large result payloads (see APIClient); handlers keep seeing
+    plain JSON because the body and headers are rewritten before routing.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (b"content-encoding", b"gzip") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(b"".join(chunks), MAX_DECOMPRESSED_SIZE)
+        except zlib.error:
+            await PlainTextResponse("Invalid gzip request body", status_code=400)(scope, receive, send)
+            return
+        if decompressor.unconsumed_tail:
+            await PlainTextResponse("Request body too large", status_code=413)(scope, receive, send)
+            return
+
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+
+        body_sent = False
+
+        async def receive_body():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(dict(scope, headers=headers), receive_body, send)
\ No newline at end of file
@@ -1,18 +1,76 @@
+import asyncio
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from ..db.models import LogEntry
 
+# Request logs are written in batches: at most every LOG_FLUSH_INTERVAL
+# seconds, or as soon as LOG_FLUSH_SIZE entries are waiting
+LOG_FLUSH_INTERVAL = 0.1
+LOG_FLUSH_SIZE = 500
+
+
+class LogBuffer:
+    """Collects LogEntry documents and writes each batch with one insert_many"""
+
+    def __init__(self, flush_interval: float = LOG_FLUSH_INTERVAL, flush_size: int = LOG_FLUSH_SIZE):
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._entries: List[LogEntry] = []
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def add(self, entry: LogEntry):
+        """Queue an entry, starting the background flusher on first use"""
+        self._entries.append(entry)
+        if (self._task is None or self._task.done()) and not self._closing:
+            self._task = asyncio.create_task(self._run())
+        if len(self._entries) >= self.flush_size:
+            self._full.set()
+
+    async def _run(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
+
+    async def flush(self):
+        """Write every queued entry"""
+        if not self._entries:
+            return
+        entries, self._entries = self._entries, []
+        try:
+            await LogEntry.insert_many(entries)
+        except Exception as e:
+            # Don't let logging failures affect the API
+            print(f"Failed to write {len(entries)} request logs: {e}")
+
+    async def close(self):
+        """Stop the flusher once its in-flight write is done, then write what is still queued"""
+        self._closing = True
+        self._full.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+
+log_buffer = LogBuffer()
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log all API requests to MongoDB"""
 
     async def dispatch(self, request: Request, call_next):
-        # Record start time
-        start_time = time.time()
+        # Record start time (monotonic, so clock adjustments cannot skew it)
+        start_ns = time.perf_counter_ns()
 
         # Extract user from token if present
         user = None
@@ -29,7 +87,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Calculate response time
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         # Get client IP
         client_ip = request.client.host if request.client else None
@@ -50,8 +108,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 error_message=None if response.status_code < 400 else f"HTTP {response.status_code}"
             )
 
-            # Save to MongoDB asynchronously (fire and forget to not slow down response)
-            await log_entry.insert()
+            # Queued and written in batches, so the response never waits on MongoDB
+            log_buffer.add(log_entry)
 
         except Exception as e:
             # Don't let logging failures affect the API response
@@ -63,12 +121,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
 async def get_current_user_from_token(token: str) -> Optional[str]:
     """Extract current user from JWT token"""
-    try:
-        from jose import jwt
-        from pwc.settings import settings
-
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
-        username: str = payload.get("sub")
-        return username
-    except:
-        return None
\ No newline at end of file
+    from ..core.security import decode_user_token
+
+    # Shares the verified-token cache with the handlers' auth dependency
+    token_user = decode_user_token(token)
+    return token_user.username if token_user else None
\ No newline at end of file
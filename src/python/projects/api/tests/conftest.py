@@ -74,6 +74,7 @@ def mock_storage():
     """Mock storage for testing"""
     mock = MagicMock()
     mock.save = AsyncMock(return_value="test/path/file.pdf")
+    mock.save_file = AsyncMock(return_value=("test/path/file.pdf", 16))
     mock.load = AsyncMock(return_value=b"fake pdf content")
     mock.read_file = AsyncMock(return_value=b"fake pdf content")
     return mock
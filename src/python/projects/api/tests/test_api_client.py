@@ -0,0 +1,259 @@
+"""Unit tests for the worker API clients"""
+
+import asyncio
+import httpx
+import pytest
+from bson import ObjectId
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pwc.api_interface import DirectWriteAPIClient
+from pwc.api_interface.client import APIClient, MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY
+from pwc.task_interface.schema import ContractAnalysisResult, ContractEvaluationResult, ContractState
+
+
+def make_api_client(outcomes, requests):
+    """APIClient whose requests get the given responses or raise the given errors, in order"""
+    def handler(request):
+        requests.append(request)
+        outcome = outcomes[len(requests) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    api_client = APIClient("http://test", "test-token")
+    api_client.client = httpx.AsyncClient(
+        base_url=api_client.base_url,
+        transport=httpx.MockTransport(handler)
+    )
+    return api_client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Retry immediately instead of sleeping between attempts"""
+    with patch.object(APIClient, "_retry_delay", return_value=0):
+        yield
+
+
+class TestRetryPolicy:
+    """Test which requests _make_request retries"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+    async def test_retries_retryable_status(self, status_code):
+        """Test GETs are retried on 429 and 5xx responses"""
+        requests = []
+        api_client = make_api_client([httpx.Response(status_code), httpx.Response(200)], requests)
+
+        response = await api_client._make_request("GET", "contract_id/internal")
+
+        assert response.status_code == 200
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [400, 401, 403, 404, 422])
+    async def test_does_not_retry_client_errors(self, status_code):
+        """Test 4xx responses other than 429 fail on the first attempt"""
+        requests = []
+        api_client = make_api_client([httpx.Response(status_code), httpx.Response(200)], requests)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await api_client._make_request("GET", "contract_id/internal")
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_errors(self):
+        """Test connection failures are retried"""
+        requests = []
+        api_client = make_api_client([httpx.ConnectError("refused"), httpx.Response(200)], requests)
+
+        response = await api_client._make_request("GET", "contract_id/internal")
+
+        assert response.status_code == 200
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test the last failure is raised once every attempt is used"""
+        requests = []
+        api_client = make_api_client([httpx.Response(503)] * MAX_ATTEMPTS, requests)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await api_client._make_request("GET", "contract_id/internal")
+        assert len(requests) == MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_by_default(self):
+        """Test POSTs without an idempotency key are sent once"""
+        requests = []
+        api_client = make_api_client([httpx.Response(503), httpx.Response(200)], requests)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await api_client._make_request("POST", "contract_id/internal/set-analysis-result")
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_post_retried_with_idempotency_key(self):
+        """Test POSTs carrying an Idempotency-Key header are retried"""
+        requests = []
+        api_client = make_api_client([httpx.Response(503), httpx.Response(200)], requests)
+
+        await api_client._make_request(
+            "POST",
+            "contract_id/internal/set-analysis-result",
+            headers={"Idempotency-Key": "key"}
+        )
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_post_retried_when_idempotent(self):
+        """Test POSTs marked idempotent are retried"""
+        requests = []
+        api_client = make_api_client([httpx.ConnectError("refused"), httpx.Response(200)], requests)
+
+        await api_client._make_request(
+            "POST",
+            "contract_id/internal/set-analysis-result",
+            idempotent=True
+        )
+        assert len(requests) == 2
+
+
+class TestRetryDelay:
+    """Test the delay between attempts"""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self):
+        """Use the real _retry_delay here"""
+        yield
+
+    def test_honours_retry_after_seconds(self):
+        """Test a Retry-After in seconds is used as the delay"""
+        response = httpx.Response(429, headers={"Retry-After": "1"})
+        assert APIClient._retry_delay(0, response) == 1.0
+
+    def test_caps_retry_after(self):
+        """Test a long Retry-After is capped at RETRY_MAX_DELAY"""
+        response = httpx.Response(503, headers={"Retry-After": "3600"})
+        assert APIClient._retry_delay(0, response) == RETRY_MAX_DELAY
+
+    def test_http_date_retry_after_uses_backoff(self):
+        """Test a Retry-After date falls back to jittered backoff"""
+        response = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        delay = APIClient._retry_delay(1, response)
+        assert RETRY_BASE_DELAY * 2 * 0.5 <= delay <= RETRY_BASE_DELAY * 2 * 1.5
+
+    def test_backoff_without_response(self):
+        """Test transport errors back off exponentially, capped before jitter"""
+        assert RETRY_BASE_DELAY * 0.5 <= APIClient._retry_delay(0, None) <= RETRY_BASE_DELAY * 1.5
+        assert APIClient._retry_delay(20, None) <= RETRY_MAX_DELAY * 1.5
+
+
+class TestSharedClients:
+    """Test the per-event-loop connection pool registry"""
+
+    def test_pool_shared_per_loop(self):
+        """Test clients on one loop share a pool, whatever their token, and a new loop gets its own"""
+        async def get_pair():
+            return APIClient.get_shared("http://test", "token1"), APIClient.get_shared("http://test/", "token2")
+
+        first, same_loop = asyncio.run(get_pair())
+        other_loop, _ = asyncio.run(get_pair())
+
+        assert first.client is same_loop.client
+        assert first._in_flight is same_loop._in_flight
+        assert other_loop.client is not first.client
+
+    def test_requires_running_loop(self):
+        """Test get_shared refuses to bind a client outside an event loop"""
+        with pytest.raises(RuntimeError):
+            APIClient.get_shared("http://test", "token")
+
+    @pytest.mark.asyncio
+    async def test_each_client_sends_its_own_token(self):
+        """Test clients sharing a pool authenticate with their own token"""
+        requests = []
+        first = make_api_client([httpx.Response(200), httpx.Response(200)], requests)
+        second = APIClient("http://test", "other-token", pool=(first.client, first._in_flight))
+
+        await first._make_request("GET", "contract_id/internal")
+        await second._make_request("PUT", "contract_id/internal/failed", headers={"Content-Type": "application/json"})
+
+        assert requests[0].headers["Authorization"] == "Bearer test-token"
+        assert requests[1].headers["Authorization"] == "Bearer other-token"
+        assert requests[1].headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_shared_pool_survives_client_close(self):
+        """Test closing a client from get_shared leaves the shared pool open"""
+        api_client = APIClient.get_shared("http://test", "token")
+
+        await api_client.aclose()
+
+        assert not api_client.client.is_closed
+        await APIClient.aclose_shared()
+        assert api_client.client.is_closed
+
+
+def make_direct_client(matched_count=1):
+    """DirectWriteAPIClient whose contracts collection is a mock"""
+    api_client = DirectWriteAPIClient("http://test", "test-token")
+    api_client.contracts = MagicMock()
+    api_client.contracts.update_one = AsyncMock(return_value=MagicMock(matched_count=matched_count))
+    return api_client
+
+
+class TestDirectWriteAPIClient:
+    """Test the updates DirectWriteAPIClient sends to MongoDB"""
+
+    contract_id = str(ObjectId())
+
+    @pytest.mark.asyncio
+    async def test_evaluation_and_transition_is_one_update(self):
+        """Test results, state and pipeline run are written with a single update_one"""
+        api_client = make_direct_client()
+        evaluation = ContractEvaluationResult(
+            approved=True,
+            reasoning="ok",
+            risk_score=0.1,
+            recommendations=[],
+            critical_issues=[],
+            processing_time=1.0
+        )
+        analysis = ContractAnalysisResult(clauses=[], metadata={}, processing_time=1.0, model_used="model")
+
+        await api_client.save_evaluation_and_transition(
+            self.contract_id,
+            evaluation,
+            ContractState.completed,
+            run_id="run_id",
+            analysis=analysis
+        )
+
+        api_client.contracts.update_one.assert_awaited_once()
+        query, update = api_client.contracts.update_one.await_args.args
+        assert query == {"_id": ObjectId(self.contract_id)}
+        assert update["$set"]["status"] == ContractState.completed.value
+        assert update["$set"]["evaluation_result"] == evaluation.model_dump()
+        assert update["$set"]["analysis_result"] == analysis.model_dump()
+        assert "updated_at" in update["$set"]
+        assert update["$push"]["pipeline_runs"]["run_id"] == "run_id"
+
+    @pytest.mark.asyncio
+    async def test_state_change_without_run_id(self):
+        """Test a state change without a run ID does not record a pipeline run"""
+        api_client = make_direct_client()
+
+        await api_client.update_contract_state(self.contract_id, ContractState.processing)
+
+        _, update = api_client.contracts.update_one.await_args.args
+        assert update["$set"]["status"] == ContractState.processing.value
+        assert "$push" not in update
+
+    @pytest.mark.asyncio
+    async def test_missing_contract_raises(self):
+        """Test writing to a contract that does not exist fails"""
+        api_client = make_direct_client(matched_count=0)
+
+        with pytest.raises(ValueError):
+            await api_client.report_failure(self.contract_id, "failed")
\ No newline at end of file
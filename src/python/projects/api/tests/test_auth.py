@@ -3,6 +3,7 @@
 import pytest
 from fastapi import HTTPException
 from unittest.mock import AsyncMock, patch
+from pymongo.errors import DuplicateKeyError
 
 
 class TestAuthenticationEndpoints:
@@ -22,11 +23,10 @@ class TestAuthenticationEndpoints:
 
     def test_register_user_duplicate_username(self, client, test_user_data):
         """Test registration with duplicate username"""
-        # Mock existing user
-        mock_user = AsyncMock()
-        mock_user.username = test_user_data["username"]
+        # Mock the unique username index rejecting the insert
+        error = DuplicateKeyError("duplicate key", 11000, {"keyPattern": {"username": 1}})
 
-        with patch("api.handlers.v1.auth.User.find_one", return_value=mock_user):
+        with patch("api.handlers.v1.auth.User.insert", side_effect=error):
             response = client.post("/api/v1/auth/register", json=test_user_data)
 
             assert response.status_code == 400
@@ -34,11 +34,10 @@ class TestAuthenticationEndpoints:
 
     def test_register_user_duplicate_email(self, client, test_user_data):
         """Test registration with duplicate email"""
-        # Mock no username conflict but email conflict
-        with patch("api.handlers.v1.auth.User.find_one") as mock_find:
-            # First call (username check) returns None, second call (email check) returns user
-            mock_find.side_effect = [None, AsyncMock()]
+        # Mock the unique email index rejecting the insert
+        error = DuplicateKeyError("duplicate key", 11000, {"keyPattern": {"email": 1}})
 
+        with patch("api.handlers.v1.auth.User.insert", side_effect=error):
             response = client.post("/api/v1/auth/register", json=test_user_data)
 
             assert response.status_code == 400
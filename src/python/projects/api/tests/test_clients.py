@@ -0,0 +1,102 @@
+"""Unit tests for the client handlers' aggregation queries"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from beanie import PydanticObjectId
+from fastapi import HTTPException
+
+from api.core.security import TokenUser
+from api.handlers.v1.clients import get_client_contracts, list_clients
+
+current_user = TokenUser(username="testuser", user_id="user_id", email="test@example.com", is_active=True)
+
+
+def aggregate_returning(rows):
+    """Mock of a Document.aggregate whose cursor yields ``rows``"""
+    return MagicMock(return_value=MagicMock(to_list=AsyncMock(return_value=rows)))
+
+
+class TestClientContracts:
+    """Test get_client_contracts' single $lookup query"""
+
+    @pytest.mark.asyncio
+    async def test_returns_contract_summaries(self):
+        """Test the client and its contracts come from one aggregate call"""
+        client_id = PydanticObjectId()
+        contract_id = PydanticObjectId()
+        row = {
+            "_id": client_id,
+            "created_by": "testuser",
+            "contracts": [{
+                "_id": contract_id,
+                "filename": "test.pdf",
+                "status": "completed",
+                "created_at": datetime(2026, 1, 1)
+            }]
+        }
+
+        with patch("api.handlers.v1.clients.Client.aggregate", aggregate_returning([row])) as aggregate:
+            contracts = await get_client_contracts(str(client_id), current_user=current_user)
+
+        aggregate.assert_called_once()
+        pipeline = aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"_id": client_id}}
+        assert pipeline[1]["$lookup"]["foreignField"] == "client_id"
+        assert [(c.id, c.filename, c.status) for c in contracts] == [(str(contract_id), "test.pdf", "completed")]
+
+    @pytest.mark.asyncio
+    async def test_missing_client_is_404(self):
+        """Test an unknown client ID returns 404"""
+        with patch("api.handlers.v1.clients.Client.aggregate", aggregate_returning([])):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_client_contracts(str(PydanticObjectId()), current_user=current_user)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_invalid_client_id_is_404(self):
+        """Test a malformed client ID returns 404 without querying"""
+        with patch("api.handlers.v1.clients.Client.aggregate", aggregate_returning([])) as aggregate:
+            with pytest.raises(HTTPException) as exc_info:
+                await get_client_contracts("not-an-id", current_user=current_user)
+
+        assert exc_info.value.status_code == 404
+        aggregate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_other_users_client_is_403(self):
+        """Test a client created by someone else is refused"""
+        row = {"_id": PydanticObjectId(), "created_by": "someone_else", "contracts": []}
+
+        with patch("api.handlers.v1.clients.Client.aggregate", aggregate_returning([row])):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_client_contracts(str(row["_id"]), current_user=current_user)
+
+        assert exc_info.value.status_code == 403
+
+
+class TestListClients:
+    """Test list_clients' grouped contract counts"""
+
+    @pytest.mark.asyncio
+    async def test_counts_come_from_one_group_query(self):
+        """Test every client's contract count comes from a single $group aggregate"""
+        clients = [
+            MagicMock(id=PydanticObjectId(), email=None, company=None, created_by="testuser",
+                      created_at=datetime(2026, 1, 1))
+            for _ in range(2)
+        ]
+        for i, client in enumerate(clients):
+            client.name = f"client {i}"
+        counts = [{"_id": clients[0].id, "count": 3}]
+
+        with patch("api.handlers.v1.clients.Client") as client_class, \
+                patch("api.handlers.v1.clients.Contract.aggregate", aggregate_returning(counts)) as aggregate:
+            client_class.find.return_value.to_list = AsyncMock(return_value=clients)
+            response = await list_clients(current_user=current_user)
+
+        aggregate.assert_called_once()
+        pipeline = aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"client_id": {"$in": [client.id for client in clients]}}}
+        assert [client.contract_count for client in response] == [3, 0]
\ No newline at end of file
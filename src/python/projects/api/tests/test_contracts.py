@@ -27,6 +27,7 @@ class TestContractEndpoints:
 
                 mock_contract_class.return_value = mock_contract
                 mock_contract.insert = AsyncMock()
+                mock_contract.set = AsyncMock()
 
                 with patch("api.handlers.v1.contracts.get_current_user") as mock_auth:
                     mock_auth.return_value = MagicMock(username="testuser")
@@ -81,7 +82,7 @@ class TestContractEndpoints:
 
         with patch("api.handlers.v1.contracts.Contract.find") as mock_find:
             mock_query = MagicMock()
-            mock_query.skip.return_value.limit.return_value.to_list = AsyncMock(return_value=mock_contracts)
+            mock_query.skip.return_value.limit.return_value.project.return_value.to_list = AsyncMock(return_value=mock_contracts)
             mock_find.return_value = mock_query
 
             with patch("api.handlers.v1.contracts.get_current_user") as mock_auth:
@@ -144,22 +145,18 @@ class TestContractEndpoints:
         with patch("api.handlers.v1.contracts.Contract.get", return_value=mock_contract):
             with patch("api.handlers.v1.contracts.get_current_user") as mock_auth:
                 with patch("api.handlers.v1.contracts.celery_app") as mock_celery:
-                    mock_signature = MagicMock()
-                    mock_celery.signature.return_value = mock_signature
-
-                    mock_chain = MagicMock()
-                    mock_chain.apply_async.return_value = MagicMock(id="task_123")
-
-                    with patch("api.handlers.v1.contracts.chain", return_value=mock_chain):
-                        mock_auth.return_value = MagicMock(username="testuser")
+                    mock_celery.send_task.return_value = MagicMock(id="task_123")
+                    mock_auth.return_value = MagicMock(username="testuser")
 
-                        response = await async_client.post("/api/v1/contracts/test_id/init-genai")
+                    response = await async_client.post("/api/v1/contracts/test_id/init-genai")
 
-                        assert response.status_code == 200
-                        data = response.json()
-                        assert "Analysis pipeline triggered" in data["message"]
-                        assert "task_id" in data
-                        assert "run_id" in data
+                    assert response.status_code == 200
+                    data = response.json()
+                    assert "Analysis pipeline triggered" in data["message"]
+                    assert "task_id" in data
+                    assert "run_id" in data
+                    mock_celery.send_task.assert_called_once()
+                    assert mock_celery.send_task.call_args.args[0] == "contract_analysis.run_pipeline"
 
 
 class TestContractValidation:
@@ -1,5 +1,6 @@
 """Unit tests for GenAI module"""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import io
@@ -11,7 +12,7 @@ class TestGenAIEndpoints:
     @pytest.mark.asyncio
     async def test_analyze_contract_success(self, async_client, mock_ai_client, sample_pdf_content):
         """Test successful contract analysis"""
-        with patch("api.handlers.v1.genai.ai_client", mock_ai_client):
+        with patch("api.handlers.v1.genai.get_ai_client", return_value=mock_ai_client):
             files = {"file": ("test.pdf", io.BytesIO(sample_pdf_content), "application/pdf")}
 
             # Mock authentication
@@ -42,7 +43,7 @@ class TestGenAIEndpoints:
     @pytest.mark.asyncio
     async def test_analyze_document_by_id_success(self, async_client, mock_ai_client, mock_contract, mock_storage):
         """Test successful document analysis by ID"""
-        with patch("api.handlers.v1.genai.ai_client", mock_ai_client):
+        with patch("api.handlers.v1.genai.get_ai_client", return_value=mock_ai_client):
             with patch("api.handlers.v1.genai.storage", mock_storage):
                 with patch("api.handlers.v1.genai.Contract.get", return_value=mock_contract):
                     with patch("api.handlers.v1.genai.get_current_user") as mock_auth:
@@ -71,7 +72,7 @@ class TestGenAIEndpoints:
     @pytest.mark.asyncio
     async def test_evaluate_document_success(self, async_client, mock_ai_client, mock_contract):
         """Test successful document evaluation"""
-        with patch("api.handlers.v1.genai.ai_client", mock_ai_client):
+        with patch("api.handlers.v1.genai.get_ai_client", return_value=mock_ai_client):
             with patch("api.handlers.v1.genai.Contract.get", return_value=mock_contract):
                 with patch("api.handlers.v1.genai.get_current_user") as mock_auth:
                     mock_auth.return_value = MagicMock(id="testuser", username="testuser")
@@ -113,7 +114,7 @@ class TestGenAIEndpoints:
             ]
         }
 
-        with patch("api.handlers.v1.genai.ai_client", mock_ai_client):
+        with patch("api.handlers.v1.genai.get_ai_client", return_value=mock_ai_client):
             with patch("api.handlers.v1.genai.get_current_user") as mock_auth:
                 mock_auth.return_value = MagicMock(id="test_user", username="testuser")
 
@@ -215,4 +216,55 @@ class TestPDFProcessing:
         invalid_content_type = "text/plain"
 
         assert valid_content_type == "application/pdf"
-        assert invalid_content_type != "application/pdf"
\ No newline at end of file
+        assert invalid_content_type != "application/pdf"
+
+class TestAnalyzeAndEvaluateBatch:
+    """Test AIInterface.analyze_and_evaluate_batch"""
+
+    @staticmethod
+    def make_ai(fail_on=(), delay=0.0):
+        from pwc.ai.base import AIInterface, ContractAnalysisResult, ContractEvaluationResult
+
+        class FakeAI(AIInterface):
+            running = 0
+            max_running = 0
+
+            async def analyze_contract(self, contract_text):
+                FakeAI.running += 1
+                FakeAI.max_running = max(FakeAI.max_running, FakeAI.running)
+                await asyncio.sleep(delay)
+                FakeAI.running -= 1
+                if contract_text in fail_on:
+                    raise RuntimeError(f"analysis failed for {contract_text}")
+                return ContractAnalysisResult(clauses=[], summary=contract_text)
+
+            async def evaluate_contract(self, clauses):
+                return ContractEvaluationResult(approved=True, reasoning="ok")
+
+        return FakeAI()
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self):
+        """Test every contract is analyzed and evaluated, in input order"""
+        results = await self.make_ai().analyze_and_evaluate_batch(["a", "b", "c"])
+
+        assert [analysis.summary for analysis, _ in results] == ["a", "b", "c"]
+        assert all(evaluation.approved for _, evaluation in results)
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_other_results(self):
+        """Test a failing contract yields its error without discarding the others"""
+        results = await self.make_ai(fail_on={"b"}).analyze_and_evaluate_batch(["a", "b", "c"])
+
+        assert results[0][0].summary == "a"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2][0].summary == "c"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency contracts run at once"""
+        ai = self.make_ai(delay=0.01)
+
+        await ai.analyze_and_evaluate_batch([str(i) for i in range(10)], max_concurrency=3)
+
+        assert type(ai).max_running == 3
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""Unit tests for the request logging buffer and gzip request middleware"""
+
+import gzip
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from api.middleware.gzip_request import GZipRequestMiddleware
+from api.middleware.logging import LogBuffer
+
+
+async def echo(request: Request):
+    return Response(await request.body(), headers={"X-Content-Length": request.headers["content-length"]})
+
+
+echo_client = TestClient(GZipRequestMiddleware(Starlette(routes=[Route("/", echo, methods=["POST"])])))
+
+
+class TestGZipRequestMiddleware:
+    """Test gzip request body inflation"""
+
+    def test_inflates_gzip_body(self):
+        """Test handlers receive the decompressed body and a matching content-length"""
+        body = b'{"result": "' + b"x" * 10000 + b'"}'
+        response = echo_client.post("/", content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.content == body
+        assert response.headers["X-Content-Length"] == str(len(body))
+
+    def test_passes_plain_body_through(self):
+        """Test bodies without Content-Encoding are untouched"""
+        response = echo_client.post("/", content=b'{"result": 1}')
+
+        assert response.content == b'{"result": 1}'
+
+    def test_rejects_invalid_gzip(self):
+        """Test a body that is not gzip returns 400"""
+        response = echo_client.post("/", content=b"not gzip", headers={"Content-Encoding": "gzip"})
+
+        assert response.status_code == 400
+
+    def test_rejects_oversized_body(self):
+        """Test a body inflating past MAX_DECOMPRESSED_SIZE returns 413"""
+        with patch("api.middleware.gzip_request.MAX_DECOMPRESSED_SIZE", 100):
+            response = echo_client.post(
+                "/",
+                content=gzip.compress(b"x" * 1000),
+                headers={"Content-Encoding": "gzip"}
+            )
+
+        assert response.status_code == 413
+
+
+class TestLogBuffer:
+    """Test batched request log writes"""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_written_together(self):
+        """Test reaching flush_size writes the queued entries with one insert_many"""
+        with patch("api.middleware.logging.LogEntry.insert_many", new_callable=AsyncMock) as insert_many:
+            buffer = LogBuffer(flush_interval=60, flush_size=2)
+            buffer.add("first")
+            buffer.add("second")
+            await buffer.close()
+
+        insert_many.assert_awaited_once_with(["first", "second"])
+
+    @pytest.mark.asyncio
+    async def test_close_writes_remaining_entries(self):
+        """Test entries still queued at shutdown are written"""
+        with patch("api.middleware.logging.LogEntry.insert_many", new_callable=AsyncMock) as insert_many:
+            buffer = LogBuffer(flush_interval=60, flush_size=100)
+            buffer.add("entry")
+            await buffer.close()
+
+        insert_many.assert_awaited_once_with(["entry"])
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_swallowed(self):
+        """Test a failed write does not raise into the request path"""
+        with patch(
+            "api.middleware.logging.LogEntry.insert_many",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("database down")
+        ):
+            buffer = LogBuffer(flush_interval=60, flush_size=100)
+            buffer.add("entry")
+            await buffer.close()
\ No newline at end of file
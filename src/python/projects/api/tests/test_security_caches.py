@@ -0,0 +1,127 @@
+"""Unit tests for the token and password caches in core.security"""
+
+import asyncio
+import time
+import pytest
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from api.core import security
+from api.core.security import (
+    create_access_token,
+    decode_user_token,
+    verify_password_cached,
+    verify_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start every test with empty caches"""
+    for cache in (
+        security._token_cache,
+        security._internal_token_cache,
+        security._password_cache,
+        security._access_token_cache,
+    ):
+        cache.clear()
+    yield
+
+
+def make_user(username="testuser"):
+    return MagicMock(username=username, id="user_id", email=f"{username}@example.com", is_active=True)
+
+
+class TestTokenCache:
+    """Test verified-token caching"""
+
+    def test_repeat_token_is_decoded_once(self):
+        """Test a token is verified once and then served from the cache"""
+        token = create_access_token(make_user())
+
+        with patch.object(security.jwt, "decode", wraps=security.jwt.decode) as decode:
+            first = decode_user_token(token)
+            second = decode_user_token(token)
+
+        assert first.username == "testuser"
+        assert second is first
+        assert decode.call_count == 1
+
+    def test_cache_is_keyed_by_token_digest(self):
+        """Test raw bearer tokens are not kept as cache keys"""
+        token = create_access_token(make_user())
+        decode_user_token(token)
+
+        assert token not in security._token_cache
+        assert security._token_key(token) in security._token_cache
+
+    def test_expired_token_is_rejected(self):
+        """Test an expired token is neither accepted nor cached"""
+        token = create_access_token(make_user(), expires_delta=timedelta(seconds=-1))
+
+        assert decode_user_token(token) is None
+        assert not security._token_cache
+
+    def test_entry_never_outlives_token(self):
+        """Test a cache entry expires with its token's exp claim"""
+        security._cache_put(security._token_cache, b"key", {"exp": time.time() - 1}, "value")
+
+        assert security._cache_get(security._token_cache, b"key") is None
+
+    def test_verify_token_rejects_invalid_token(self):
+        """Test verify_token raises 401 for a token that does not verify"""
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-token")
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token(credentials)
+
+        assert exc_info.value.status_code == 401
+
+
+class TestAccessTokenCache:
+    """Test access token reuse"""
+
+    def test_same_claims_reuse_token(self):
+        """Test logins with the same claims within the window get the same token"""
+        assert create_access_token(make_user()) == create_access_token(make_user())
+
+    def test_different_claims_get_new_token(self):
+        """Test tokens are not shared between users"""
+        assert create_access_token(make_user("alice")) != create_access_token(make_user("bob"))
+
+
+class TestPasswordCache:
+    """Test cached password verification"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_bcrypt_call(self):
+        """Test identical concurrent logins run bcrypt once and later ones hit the cache"""
+        with patch.object(security, "verify_password", return_value=True) as verify:
+            results = await asyncio.gather(*(
+                verify_password_cached("testuser", "password", "hash") for _ in range(3)
+            ))
+            again = await verify_password_cached("testuser", "password", "hash")
+
+        assert results == [True, True, True]
+        assert again is True
+        assert verify.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_check_is_not_cached(self):
+        """Test a wrong password is checked again on every attempt"""
+        with patch.object(security, "verify_password", return_value=False) as verify:
+            assert await verify_password_cached("testuser", "wrong", "hash") is False
+            assert await verify_password_cached("testuser", "wrong", "hash") is False
+
+        assert verify.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_hash_is_checked_again(self):
+        """Test a new stored hash, e.g. after a password change, is not served from the cache"""
+        with patch.object(security, "verify_password", return_value=True) as verify:
+            await verify_password_cached("testuser", "password", "old_hash")
+            await verify_password_cached("testuser", "password", "new_hash")
+
+        assert verify.call_count == 2
\ No newline at end of file
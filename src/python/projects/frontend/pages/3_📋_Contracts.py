@@ -350,18 +350,12 @@ with tab3:
             # Create a nice table view
             client_data = []
             for client in clients_data:
-                # Get contract count for each client
-                contracts_response = APIClient.get(f"/clients/{client['id']}/contracts")
-                contract_count = 0
-                if contracts_response.status_code == 200:
-                    client_contracts = contracts_response.json()
-                    contract_count = len(client_contracts)
-
                 client_data.append({
                     "Name": client['name'],
                     "Company": client.get('company', 'N/A'),
                     "Email": client.get('email', 'N/A'),
-                    "Contracts": contract_count,
+                    # Counted by the API in one query for all clients
+                    "Contracts": client.get('contract_count', 0),
                     "Created": client['created_at'][:10] if client.get('created_at') else 'Unknown'
                 })
 
@@ -5,6 +5,10 @@ import streamlit as st
 from typing import Optional, Dict, Any
 from config import get_api_url, get_auth_headers
 
+# Streamlit reruns page scripts but keeps imported modules, so one pooled
+# session serves every request and reuses keep-alive connections to the API
+_SESSION = requests.Session()
+
 
 class APIClient:
     """Client for interacting with the PWC Contract Analysis API"""
@@ -16,7 +20,7 @@ class APIClient:
         headers = get_auth_headers()
 
         try:
-            response = requests.post(url, json=data, files=files, headers=headers)
+            response = _SESSION.post(url, json=data, files=files, headers=headers)
             return response
         except requests.exceptions.RequestException as e:
             st.error(f"API request failed: {str(e)}")
@@ -29,7 +33,7 @@ class APIClient:
         headers = get_auth_headers()
 
         try:
-            response = requests.get(url, params=params, headers=headers)
+            response = _SESSION.get(url, params=params, headers=headers)
             return response
         except requests.exceptions.RequestException as e:
             st.error(f"API request failed: {str(e)}")
@@ -45,7 +49,7 @@ class APIClient:
         data = additional_data or {}
 
         try:
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = _SESSION.post(url, files=files, data=data, headers=headers)
             return response
         except requests.exceptions.RequestException as e:
             st.error(f"File upload failed: {str(e)}")